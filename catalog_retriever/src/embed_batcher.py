@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Dynamic micro-batching for query embeddings.
+Concurrent retrieve calls each need one or two query vectors. MicroBatcher collects the
+inputs submitted within a few milliseconds of each other and embeds them with one request,
+so the embedding NIM sees a single batch instead of many one-vector calls.
+"""
+
+from typing import Any, Awaitable, Callable, List, Tuple
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-input requests into batched calls of embed_fn.
+    embed_fn takes a list of inputs and returns one result per input, in order.
+    """
+    def __init__(
+        self,
+        embed_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.005
+    ):
+        self.embed_fn = embed_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        # Strong references to in-flight batches, so they are not garbage collected mid-request.
+        self._in_flight: set = set()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue one input and wait for its result.
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the collecting task and cancel batches in flight and inputs still waiting in the queue.
+        """
+        tasks = list(self._in_flight)
+        if self._worker is not None:
+            tasks.append(self._worker)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    def _ensure_worker(self) -> None:
+        """
+        Start the collecting task on the running loop the first time it is needed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            # Keep collecting until the batch is full or the wait window closes.
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting, so the next batch can be collected while this one is in flight.
+            task = loop.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self.embed_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Expected {len(batch)} results, got {len(results)}")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            if len(batch) > 1:
+                # One bad input must not fail the unrelated requests it was coalesced with,
+                # so retry the inputs one at a time and let each succeed or fail on its own.
+                logger.warning("CATALOG RETRIEVER | MicroBatcher._dispatch() | Batch of %d failed, retrying inputs one at a time: %s", len(batch), e)
+                await asyncio.gather(*(self._dispatch([entry]) for entry in batch))
+                return
+            logger.error("CATALOG RETRIEVER | MicroBatcher._dispatch() | Input failed: %s", e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Embedding caches for the catalog retriever.
+EmbeddingCache persists embeddings in a SQLite table keyed by the SHA-256 hash of the model name,
+the input type and the normalized input, so unchanged products are never re-embedded.
+It also keeps the base64 form of downloaded catalog images keyed by URL hash, so repeat
+ingestion does not fetch unchanged images again.
+LRUCache is a small in-process cache used for hot query embeddings and retrieval results.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, List, Sequence, Tuple
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class EmbeddingCache:
+    """
+    Disk-backed mapping from a content hash to a float32 embedding vector.
+    """
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS downloads (key BLOB PRIMARY KEY, data TEXT NOT NULL)"
+            )
+        logger.info("CATALOG RETRIEVER | EmbeddingCache.__init__() | Using embedding cache at %s.", path)
+
+    @staticmethod
+    def make_key(model: str, input_type: str, data: str | bytes) -> bytes:
+        """
+        Build a cache key from the model name, the input type and the input itself.
+        Text inputs are stripped of surrounding whitespace before hashing.
+        """
+        if isinstance(data, str):
+            data = data.strip().encode("utf-8")
+        digest = hashlib.sha256()
+        digest.update(model.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(input_type.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(data)
+        return digest.digest()
+
+    def get_many(self, keys: Sequence[bytes]) -> List[np.ndarray | None]:
+        """
+        Look up several keys at once. Missing keys are returned as None.
+        """
+        if not keys:
+            return []
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # Stay well below SQLite's bound-parameter limit.
+        step = 500
+        with self._lock:
+            for i in range(0, len(unique_keys), step):
+                batch = unique_keys[i:i + step]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, vec in rows:
+                    found[key] = np.frombuffer(vec, dtype=np.float32)
+        return [found.get(key) for key in keys]
+
+    def put_many(self, items: Sequence[Tuple[bytes, Sequence[float]]]) -> None:
+        """
+        Store several (key, embedding) pairs in a single transaction.
+        """
+        if not items:
+            return
+        rows = [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+            )
+
+    @staticmethod
+    def _url_key(url: str) -> bytes:
+        return hashlib.sha256(url.strip().encode("utf-8")).digest()
+
+    def get_download(self, url: str) -> str | None:
+        """
+        Return the cached base64 image for a URL, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM downloads WHERE key = ?", (self._url_key(url),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_download(self, url: str, data: str) -> None:
+        """
+        Store the base64 image downloaded from a URL.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO downloads (key, data) VALUES (?, ?)", (self._url_key(url), data)
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class LRUCache:
+    """
+    Thread-safe in-process least-recently-used cache.
+    When ttl is set, entries older than ttl seconds are treated as misses.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Return the cached value for key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insert value under key, evicting the least recently used entry when full.
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from fastapi import FastAPI
+from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any
 from app.retriever import Retriever, RetrieverConfig
@@ -18,25 +19,28 @@ logging.basicConfig(
     stream=sys.stdout
 )
 
-# FastAPI app
-app = FastAPI()
+# Use the libyaml C parser when PyYAML was built with it; fall back to the pure-Python parser otherwise.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Get directory contents and report them.
 dir_contents = []
 for entry in os.listdir("."):
     dir_contents.append(entry)
-logging.info(f"CATALOG RETRIEVER | startup | Directory contents: {dir_contents}")
+logging.info("CATALOG RETRIEVER | startup | Directory contents: %s", dir_contents)
 
 # Get our configuration from config.yaml with optional override support
 def load_config_with_override(base_config_path: str):
     """Load configuration from YAML file with optional override support."""
     # Load base config
     if not os.path.exists(base_config_path):
-        logging.error(f"Base config file not found at {base_config_path}")
+        logging.error("Base config file not found at %s", base_config_path)
         raise FileNotFoundError(f"Base config file not found at {base_config_path}")
 
     with open(base_config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
     
     # Check for override config
     override_file = os.environ.get("CONFIG_OVERRIDE")
@@ -46,15 +50,15 @@ def load_config_with_override(base_config_path: str):
         override_path = os.path.join(base_dir, override_file)
         
         if os.path.exists(override_path):
-            logging.info(f"Loading override config from {override_path}")
+            logging.info("Loading override config from %s", override_path)
             with open(override_path, "r") as f:
-                override_config = yaml.safe_load(f)
+                override_config = yaml.load(f, Loader=YamlLoader)
             
             # Merge override config into base config
             config.update(override_config)
-            logging.info(f"Config override applied from {override_file}")
+            logging.info("Config override applied from %s", override_file)
         else:
-            logging.warning(f"Override config file not found at {override_path}")
+            logging.warning("Override config file not found at %s", override_path)
     else:
         logging.info("No config override specified, using base config only")
     
@@ -73,15 +77,28 @@ config = RetrieverConfig(
     db_name=data["db_name"],
     sim_threshold=data["sim_threshold"],
     text_collection=data["text_collection"],
-    image_collection=data["image_collection"]
+    image_collection=data["image_collection"],
+    embedding_cache_path=data.get("embedding_cache_path"),
+    vector_dtype=data.get("vector_dtype", "float32"),
+    text_embed_dim=data.get("text_embed_dim", 1024),
+    image_embed_dim=data.get("image_embed_dim", 1024)
 )
 
 logging.info("CATALOG RETRIEVER | startup | config.yaml ingested.")
 logging.info("CATALOG RETRIEVER | startup | Initializing Retriever object.")
 retriever = Retriever(config=config)
-logging.info("CATALOG RETRIEVER | startup | Checking and populating Milvus database if needed.")
-retriever.milvus_from_csv(csv_path=data["data_source"], verbose=True)
-logging.info("CATALOG RETRIEVER | startup | Milvus database ready.")
+
+# Populate Milvus on the server's event loop before accepting requests, and stop background work on shutdown.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logging.info("CATALOG RETRIEVER | startup | Checking and populating Milvus database if needed.")
+    await retriever.milvus_from_csv(csv_path=data["data_source"], verbose=True)
+    logging.info("CATALOG RETRIEVER | startup | Milvus database ready.")
+    yield
+    await retriever.aclose()
+
+# FastAPI app
+app = FastAPI(lifespan=lifespan)
 
 # Request bodies
 class TextQueryRequest(BaseModel):
@@ -100,7 +117,7 @@ class ImageQueryRequest(BaseModel):
 # Handles queries only containing text.
 @app.post("/query/text")
 async def query_text(req: TextQueryRequest):
-    logging.info(f"CATALOG RETRIEVER | query_text() | Received POST: {req}.")
+    logging.info("CATALOG RETRIEVER | query_text() | Received POST: %s.", req)
     texts, ids, sims, names, images = await retriever.retrieve(
         query=req.text,
         categories=req.categories,
@@ -120,7 +137,7 @@ async def query_text(req: TextQueryRequest):
 # Handles queries containing text and b64 images.
 @app.post("/query/image")
 async def query_image(req: ImageQueryRequest):
-    logging.info(f"CATALOG RETRIEVER | query_image() | Received POST.")
+    logging.info("CATALOG RETRIEVER | query_image() | Received POST.")
     texts, ids, sims, names, images = await retriever.retrieve(
         query=req.text,
         image=req.image_base64,
@@ -8,21 +8,29 @@ The second model uses text embeddings to retrieve relevant products.
 Performs both of these in parallel and then re-ranks the results from bothmodels.
 """
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
 from pydantic import BaseModel
 from typing import List, Tuple, Dict, Any
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.embeddings import Embeddings
+from langchain_core.documents import Document
 from langchain_milvus import Milvus
+from pymilvus import AsyncMilvusClient, DataType
+import httpx
+from tenacity import AsyncRetrying, Retrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import os
 import sys
 import re
 import pandas as pd
 import numpy as np
-from numpy import mean
-from .utils import image_url_to_base64, is_url, is_path, image_path_to_base64, resize_base64_image
+from .utils import image_url_to_base64, is_url, is_path, image_path_to_base64, resize_base64_image, base64_image_bytes
+from .embedding_cache import EmbeddingCache, LRUCache
+from .embed_batcher import MicroBatcher
+import hashlib
 import logging
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, zip_longest
 
 # Set up logging 
 logging.basicConfig(
@@ -30,6 +38,110 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     stream=sys.stdout
 )
+logger = logging.getLogger(__name__)
+
+# Maximum number of inputs sent to an embedding NIM in a single request.
+EMBED_BATCH_SIZE = 64
+
+# Maximum number of embedding requests in flight at once during ingestion.
+EMBED_MAX_CONCURRENCY = 8
+
+# Transient embedding NIM failures during ingestion are retried with jittered exponential backoff
+# before a batch is dropped. This is the only retry layer: the OpenAI clients are built with max_retries=0.
+EMBED_RETRY = dict(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=0.25, max=8),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+    reraise=True,
+)
+
+# User queries retry once with a short wait, so an embedding NIM outage fails the request quickly.
+QUERY_EMBED_RETRY = dict(
+    stop=stop_after_attempt(2),
+    wait=wait_exponential_jitter(initial=0.1, max=0.5),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+    reraise=True,
+)
+
+# Worker threads that download, decode and resize images ahead of the embedding requests.
+IMAGE_PREPARE_WORKERS = 16
+
+# Connection pool shared by the embedding clients. Sized above EMBED_MAX_CONCURRENCY so
+# concurrent batches for both NIMs reuse kept-alive connections instead of reconnecting.
+EMBED_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+EMBED_CONNECT_RETRIES = 2
+
+# Number of query embeddings kept in memory for repeated user queries, and how long they stay valid in seconds.
+QUERY_CACHE_SIZE = 4096
+QUERY_CACHE_TTL = 600
+
+# Milvus field names used by the LangChain Milvus wrapper for the catalog collections.
+TEXT_FIELD = "text"
+VECTOR_FIELD = "vector"
+
+# Fields fetched for each search hit: the ones retrieve actually reads. The long description is
+# already part of the text field, so it is not fetched twice.
+RESULT_FIELDS = ("pk", TEXT_FIELD, "name", "price", "image", "category", "subcategory")
+
+# Scalar field types that a price filter expression can compare against.
+NUMERIC_DTYPES = (DataType.INT8, DataType.INT16, DataType.INT32, DataType.INT64, DataType.FLOAT, DataType.DOUBLE)
+
+# Maximum number of Milvus searches in flight at once across all concurrent retrieve calls.
+MILVUS_MAX_CONCURRENCY = 16
+
+# HNSW index the catalog collections are built with, and the search-time candidate list size.
+# Stored and query vectors are unit length, so inner product ranks exactly like cosine
+# without Milvus normalizing every vector at search time.
+INDEX_PARAMS = {"index_type": "HNSW", "metric_type": "IP", "params": {"M": 16, "efConstruction": 200}}
+SEARCH_EF = 64
+
+# Query embeddings from concurrent requests are coalesced into batches of up to this size,
+# waiting at most QUERY_BATCH_WAIT seconds for a batch to fill.
+QUERY_BATCH_SIZE = 32
+QUERY_BATCH_WAIT = 0.005
+
+# Retrieval results kept in memory for repeated requests, and how long they stay valid in seconds.
+RESULT_CACHE_SIZE = 2000
+RESULT_CACHE_TTL = 300
+
+# Storage precision for catalog vectors: Milvus vector field type and the NumPy dtype sent to Milvus.
+# FLOAT16_VECTOR (Milvus 2.4+) halves index memory and insert/search payloads with no measurable recall loss.
+VECTOR_DTYPES = {
+    "float32": (DataType.FLOAT_VECTOR, np.float32),
+    "float16": (DataType.FLOAT16_VECTOR, np.float16),
+}
+
+# Text chunking used before embedding long product descriptions.
+TEXT_CHUNK_SIZE = 1000
+TEXT_CHUNK_OVERLAP = 200
+
+# Number of CSV rows embedded and inserted into Milvus per ingestion window.
+INGEST_BATCH_ROWS = 512
+
+# Number of embedded windows allowed to wait for insertion.
+INGEST_QUEUE_SIZE = 4
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a float32 matrix (or a single vector) in place and return it.
+    All-zero rows are left as zeros instead of becoming NaN.
+    """
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    vectors /= np.maximum(norms, 1e-12)
+    return vectors
+
+def normalize_embeddings(embeddings: List[Any]) -> List[List[float] | None]:
+    """
+    L2-normalize a list of embeddings as one matrix and return them as lists.
+    Failed embeddings (None) stay None.
+    """
+    normed: List[List[float] | None] = [None] * len(embeddings)
+    valid = [i for i, emb in enumerate(embeddings) if emb is not None]
+    if valid:
+        matrix = l2_normalize(np.asarray([embeddings[i] for i in valid], dtype=np.float32))
+        for i, row in zip(valid, matrix.tolist()):
+            normed[i] = row
+    return normed
 
 # Defines a type for configuring the Retriever.
 class RetrieverConfig(BaseModel):
@@ -42,6 +154,10 @@ class RetrieverConfig(BaseModel):
     sim_threshold: float
     text_collection: str
     image_collection: str
+    embedding_cache_path: str | None = None
+    vector_dtype: str = "float32"
+    text_embed_dim: int = 1024
+    image_embed_dim: int = 1024
 
 # Defines a type for storing and embedding text.
 class TextEmbeddings(Embeddings):
@@ -50,17 +166,15 @@ class TextEmbeddings(Embeddings):
 
     def embed_query(self, text: str) -> List[float]:
         """Generate text embedding for a single text"""
-        logging.info(f"TextEmbeddings | embed_query() | called.\n\t| input: {text[:50]}")
+        logger.debug("TextEmbeddings | embed_query() | called.\n\t| input: %.50s", text)
         res = self.retriever.embed_chunk(text)
-        normed = res / np.linalg.norm(res)
-        return normed
+        # embed_chunk may return a cached read-only vector, so normalize a copy.
+        return l2_normalize(np.array(res, dtype=np.float32))
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generate text embeddings for multiple texts"""
-        logging.info(f"TextEmbeddings | embed_documents() | called.")
-        res = self.retriever.text_embeddings(texts)
-        normed = [list(r/np.linalg.norm(r) for r in res)]
-        return normed
+        logger.debug("TextEmbeddings | embed_documents() | called.")
+        return normalize_embeddings(self.retriever.text_embeddings(texts))
 
 # Defines a type for storing and embedding images.
 class ImageEmbeddings(Embeddings):
@@ -69,19 +183,21 @@ class ImageEmbeddings(Embeddings):
 
     def embed_query(self, text: str) -> List[float]:
         """Generate image embedding for a single image"""
-        logging.info(f"ImageEmbeddings | embed_query() | called.\n\t| input: {text[:50]}")
-        embeddings = self.retriever.image_embeddings([text], verbose=True)
-        if embeddings and embeddings[0] is not None:
-            logging.info(f"ImageEmbeddings | embed_query() | embedding output:\n\t| {embeddings[0][:50]}")
-            return embeddings[0]
+        logger.debug("ImageEmbeddings | embed_query() | called.\n\t| input: %.50s", text)
+        embedding = self.retriever.embed_image_query(text)
+        if embedding is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ImageEmbeddings | embed_query() | embedding output:\n\t| %s", embedding[:50])
+            # embed_image_query may return a cached read-only vector, so normalize a copy.
+            return l2_normalize(np.array(embedding, dtype=np.float32))
         else:
-            logging.error(f"ImageEmbeddings | embed_query() | Failed to generate embedding for image")
+            logger.error("ImageEmbeddings | embed_query() | Failed to generate embedding for image")
             raise ValueError("Failed to generate image embedding")
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generate image embeddings for multiple images"""
-        logging.info(f"ImageEmbeddings | embed_query() | called.")
-        return self.retriever.image_embeddings(texts)
+        logger.debug("ImageEmbeddings | embed_documents() | called.")
+        return normalize_embeddings(self.retriever.image_embeddings(texts))
 
 class Retriever:
     """
@@ -100,24 +216,78 @@ class Retriever:
         self.sim_threshold = config.sim_threshold
         self.text_collection = config.text_collection
         self.image_collection = config.image_collection
+        if config.vector_dtype not in VECTOR_DTYPES:
+            raise ValueError(f"Unsupported vector_dtype '{config.vector_dtype}', expected one of {list(VECTOR_DTYPES)}")
+        self.vector_dtype = config.vector_dtype
 
         # Keys.
         embed_key = os.environ["EMBED_API_KEY"]
 
+        # One pooled HTTP client per flavour, shared by the text and image embedding clients.
+        # The transports also retry failed connection attempts, which never reach the NIM.
+        http_client = httpx.Client(
+            transport=httpx.HTTPTransport(limits=EMBED_HTTP_LIMITS, retries=EMBED_CONNECT_RETRIES)
+        )
+        http_client_async = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(limits=EMBED_HTTP_LIMITS, retries=EMBED_CONNECT_RETRIES)
+        )
+
         self.text_client = OpenAI(
             api_key=embed_key,
-            base_url=self.text_embed_port
+            base_url=self.text_embed_port,
+            http_client=http_client,
+            max_retries=0
         )
         self.image_client = OpenAI(
             api_key=embed_key,
-            base_url=self.image_embed_port
+            base_url=self.image_embed_port,
+            http_client=http_client,
+            max_retries=0
         )
 
+        # Async clients used to fan out ingestion batches concurrently.
+        self.text_client_async = AsyncOpenAI(
+            api_key=embed_key,
+            base_url=self.text_embed_port,
+            http_client=http_client_async,
+            max_retries=0
+        )
+        self.image_client_async = AsyncOpenAI(
+            api_key=embed_key,
+            base_url=self.image_embed_port,
+            http_client=http_client_async,
+            max_retries=0
+        )
+        self._embed_semaphore = asyncio.Semaphore(EMBED_MAX_CONCURRENCY)
+        # Worker pool for the sync embedding paths; its size bounds concurrent requests the same way.
+        self._embed_executor = ThreadPoolExecutor(max_workers=EMBED_MAX_CONCURRENCY, thread_name_prefix="embed")
+        # Separate pool for image preparation, so embedding workers can wait on it without starving it.
+        self._image_executor = ThreadPoolExecutor(max_workers=IMAGE_PREPARE_WORKERS, thread_name_prefix="image")
+
+        # Persistent embedding cache, so unchanged products are not re-embedded.
+        self.embedding_cache = EmbeddingCache(config.embedding_cache_path) if config.embedding_cache_path else None
+
+        # Text splitter used to chunk long product descriptions before embedding.
+        self.text_splitter = RecursiveCharacterTextSplitter(chunk_size=TEXT_CHUNK_SIZE, chunk_overlap=TEXT_CHUNK_OVERLAP)
+
+        # In-process cache for query embeddings, so repeated queries skip the embedding NIMs.
+        self._query_cache = LRUCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+
+        # Coalesces query embeddings from concurrent retrieve calls into batched NIM requests.
+        self._query_batcher = MicroBatcher(
+            self._aembed_query_batch,
+            max_batch_size=QUERY_BATCH_SIZE,
+            max_wait=QUERY_BATCH_WAIT
+        )
+
+        # Short-lived cache of full retrieval results, cleared whenever the catalog is repopulated.
+        self._result_cache = LRUCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+
         # Create embedding classes
         self.text_embeddings_obj = TextEmbeddings(self)
         self.image_embeddings_obj = ImageEmbeddings(self)
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.__init__() | Initializing Milvus connections.")
+        logger.info("CATALOG RETRIEVER | Retriever.__init__() | Initializing Milvus connections.")
 
 
         # Initialize Milvus with embedding classes
@@ -126,45 +296,103 @@ class Retriever:
             collection_name=self.text_collection,
             connection_args={"uri": f"{self.db_port}"},
             auto_id=True,
-            index_params={"metric_type": "COSINE"},
+            index_params=INDEX_PARAMS,
+            vector_schema=self._vector_schema(config.text_embed_dim),
         )
         self.image_db = Milvus(
             embedding_function=self.image_embeddings_obj,
             collection_name=self.image_collection,
             connection_args={"uri": f"{self.db_port}"},
             auto_id=True,
-            index_params={"metric_type": "COSINE"},
+            index_params=INDEX_PARAMS,
+            vector_schema=self._vector_schema(config.image_embed_dim),
         )
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.__init__() | Milvus collections initialized.")
+        # Native async client for the query path, created on first use inside the event loop.
+        self._milvus_client_async: AsyncMilvusClient | None = None
+        # Bounds the searches sent to Milvus under load; excess requests wait here instead of queueing on the server.
+        self._milvus_semaphore = asyncio.Semaphore(MILVUS_MAX_CONCURRENCY)
+        # Set once both collections are known to hold data, see embeddings_exist.
+        self._embeddings_ready = False
+        # Metric of each collection's vector index, looked up once per collection.
+        self._metric_types: Dict[str, str] = {}
+
+        logger.info("CATALOG RETRIEVER | Retriever.__init__() | Milvus collections initialized.")
+
+    async def aclose(self) -> None:
+        """
+        Stop the query micro-batcher and close the async Milvus client. Called on application shutdown.
+        """
+        await self._query_batcher.close()
+        if self._milvus_client_async is not None:
+            await self._milvus_client_async.close()
+            self._milvus_client_async = None
+
+    def _vector_schema(self, dim: int) -> Dict[str, Any] | None:
+        """
+        Vector field schema used when a catalog collection is created.
+        Float32 keeps the wrapper's default inferred schema.
+        """
+        if self.vector_dtype == "float32":
+            return None
+        return {"dtype": VECTOR_DTYPES[self.vector_dtype][0], "dim": dim}
+
+    def _vector_np_dtype(self, db: Milvus) -> type:
+        """
+        NumPy dtype matching the vector field of a collection.
+        Existing collections keep the precision they were created with, so
+        float32 collections keep working after vector_dtype is changed.
+        """
+        if db.col is not None:
+            for field in db.col.schema.fields:
+                if field.name == VECTOR_FIELD:
+                    return np.float16 if field.dtype == DataType.FLOAT16_VECTOR else np.float32
+        return VECTOR_DTYPES[self.vector_dtype][1]
+
+    def _metric_type(self, db: Milvus) -> str:
+        """
+        Metric of a collection's vector index.
+        Collections created before the switch to IP keep searching with COSINE.
+        """
+        metric = self._metric_types.get(db.collection_name)
+        if metric is None:
+            metric = INDEX_PARAMS["metric_type"]
+            for index in db.col.indexes:
+                if index.field_name == VECTOR_FIELD:
+                    metric = index.params.get("metric_type", metric)
+            self._metric_types[db.collection_name] = metric
+        return metric
 
     def embeddings_exist(self) -> bool:
         """
         Check if embeddings already exist in both text and image collections.
         Returns True if both collections have data, False otherwise.
+        The counts are read without flushing: ingestion flushes both collections when it
+        finishes. Once data is found, later calls return without asking Milvus.
         """
+        if self._embeddings_ready:
+            return True
         try:
             text_count = 0
             if self.text_db.col:
-                self.text_db.col.flush()
                 text_count = self.text_db.col.num_entities
 
             image_count = 0
             if self.image_db.col:
-                self.image_db.col.flush()
                 image_count = self.image_db.col.num_entities
             
-            logging.info(f"CATALOG RETRIEVER | embeddings_exist() | Text collection has {text_count} entities. Image collection has {image_count} entities.")
+            logger.info("CATALOG RETRIEVER | embeddings_exist() | Text collection has %s entities. Image collection has %s entities.", text_count, image_count)
             # Check text and image collections
             if text_count > 0 and image_count > 0:
-                logging.info("CATALOG RETRIEVER | embeddings_exist() | Embeddings found in both collections.")
+                logger.info("CATALOG RETRIEVER | embeddings_exist() | Embeddings found in both collections.")
+                self._embeddings_ready = True
                 return True
             else:
-                logging.info("CATALOG RETRIEVER | embeddings_exist() | No embeddings found in either collection.")
+                logger.info("CATALOG RETRIEVER | embeddings_exist() | No embeddings found in either collection.")
                 return False
             
         except Exception as e:
-            logging.info(f"CATALOG RETRIEVER | embeddings_exist() | Error checking embeddings: {e}")
+            logger.info("CATALOG RETRIEVER | embeddings_exist() | Error checking embeddings: %s", e)
             return False
 
     def embed_chunk(
@@ -173,25 +401,261 @@ class Retriever:
         query_type: str = "query"
         ) -> List[float]:
         """
-        Embed a chunk of text.
+        Embed a chunk of text. Query embeddings are memoized in the in-process query cache only
+        and never written to the persistent cache; passages are one-shot ingestion inputs and
+        only go through the persistent cache.
+        """
+        if query_type != "query":
+            return np.asarray(self._embed_batch([chunk], query_type)[0], dtype=np.float32)
+
+        key = self._text_query_key(chunk, query_type)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        embedding = np.asarray(self._embed_batch([chunk], query_type, retry_policy=QUERY_EMBED_RETRY, persist=False)[0], dtype=np.float32)
+        embedding.setflags(write=False)
+        self._query_cache.put(key, embedding)
+        return embedding
+
+    def embed_image_query(self, image: str) -> List[float] | None:
+        """
+        Embed a single query image. Results are memoized in the in-process query cache.
+        """
+        key = self._image_query_key(image)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Query images are user uploads: they may hit the persistent cache, but are never written to it.
+        input_data = self._prepare_image_input(image, True, False)
+        if input_data is None:
+            return None
+        try:
+            embeddings = self._embed_image_batch([input_data], retry_policy=QUERY_EMBED_RETRY, persist=False)
+        except Exception as e:
+            self._log_image_batch_error(e)
+            return None
+
+        embedding = np.asarray(embeddings[0], dtype=np.float32)
+        embedding.setflags(write=False)
+        self._query_cache.put(key, embedding)
+        return embedding
+
+    async def _aembed_query_texts(self, queries: List[str]) -> List[np.ndarray]:
+        """
+        Embed text queries with the async client and return them L2-normalized.
+        Queries missing from the in-process query cache (shared with embed_chunk)
+        go through the micro-batcher, which embeds them together with the queries
+        of other concurrent requests.
+        """
+        keys = [self._text_query_key(query, "query") for query in queries]
+        embeddings = [self._query_cache.get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            fresh = await asyncio.gather(*(self._query_batcher.submit(queries[i]) for i in missing))
+            for i, vec in zip(missing, fresh):
+                embedding = np.asarray(vec, dtype=np.float32)
+                embedding.setflags(write=False)
+                self._query_cache.put(keys[i], embedding)
+                embeddings[i] = embedding
+        return list(l2_normalize(np.stack(embeddings)))
+
+    async def _aembed_query_batch(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed one micro-batch of text queries with a single request.
         """
-        response = self.text_client.embeddings.create(
-            input=chunk,
+        return await self._aembed_batch(
+            self.text_client_async,
+            self.text_model_name,
+            queries,
+            extra_body={"input_type": "query", "truncate": "NONE"},
+            retry_policy=QUERY_EMBED_RETRY
+        )
+
+    async def _aembed_query_image(self, image: str) -> np.ndarray:
+        """
+        Embed a query image with the async client.
+        Shares the in-process query cache with embed_image_query.
+        """
+        key = self._image_query_key(image)
+        embedding = self._query_cache.get(key)
+        if embedding is not None:
+            return embedding
+
+        # Decoding or downloading the image is blocking work, keep it off the event loop.
+        input_data = await asyncio.get_running_loop().run_in_executor(
+            self._image_executor, self._prepare_image_input, image, True, False
+        )
+        if input_data is None:
+            logger.error("CATALOG RETRIEVER | Retriever._aembed_query_image() | Failed to prepare image for embedding")
+            raise ValueError("Failed to generate image embedding")
+
+        # A URL or path query resolves to image bytes that may already be cached under their content key.
+        content_key = self._image_query_key(input_data)
+        if content_key != key:
+            embedding = self._query_cache.get(content_key)
+            if embedding is not None:
+                self._query_cache.put(key, embedding)
+                return embedding
+
+        # Catalog images used as queries are usually already in the persistent embedding cache.
+        # Other query images are user uploads, so their embeddings only go to the in-process query cache.
+        embeddings = await self._aembed_batch(
+            self.image_client_async,
+            self.image_model_name,
+            [input_data],
+            cache_keys=self._image_cache_keys([input_data]),
+            retry_policy=QUERY_EMBED_RETRY,
+            persist=False
+        )
+        embedding = np.asarray(embeddings[0], dtype=np.float32)
+        embedding.setflags(write=False)
+        self._query_cache.put(key, embedding)
+        self._query_cache.put(content_key, embedding)
+        return embedding
+
+    def _text_query_key(self, text: str, query_type: str) -> Tuple[str, str, str]:
+        """
+        Query cache key for a text input.
+        """
+        return (self.text_model_name, query_type, text)
+
+    def _image_query_key(self, image: str) -> Tuple[str, str, bytes]:
+        """
+        Query cache key for an image input, hashed so multi-kilobyte base64 strings are not kept as keys.
+        Base64 images are hashed on their decoded bytes, so the same image with a different data URI
+        header or line wrapping maps to the same entry.
+        """
+        data = image.encode("utf-8") if is_url(image) or is_path(image) else base64_image_bytes(image)
+        return (self.image_model_name, "image", hashlib.blake2b(data, digest_size=16).digest())
+
+    def _embed_batch(
+        self,
+        chunks: List[str],
+        query_type: str = "query",
+        retry_policy: Dict[str, Any] = EMBED_RETRY,
+        persist: bool = True
+    ) -> List[List[float]]:
+        """
+        Embed a list of text chunks with a single request to the text embedding NIM.
+        Chunks found in the embedding cache are not sent, and fresh embeddings are only
+        written back to it when persist is set.
+        """
+        keys = self._text_cache_keys(chunks, query_type)
+        results, missing = self._cache_lookup(keys)
+        if not missing:
+            return results
+
+        response = self._create_embeddings(
+            self.text_client,
+            retry_policy,
+            input=[chunks[i] for i in missing],
             model=self.text_model_name,
             encoding_format="float",
             extra_body={"input_type": query_type, "truncate": "NONE"}
         )
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.embed_chunk() | Chunk embedded.")
+        logger.debug("CATALOG RETRIEVER | Retriever._embed_batch() | %d chunk(s) embedded.", len(missing))
 
-        return response.data[0].embedding   
+        return self._cache_store(keys, results, missing, [d.embedding for d in response.data], persist)
+
+    async def _aembed_batch(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        inputs: List[str],
+        extra_body: Dict[str, Any] | None = None,
+        cache_keys: List[bytes] | None = None,
+        retry_policy: Dict[str, Any] = EMBED_RETRY,
+        persist: bool = True
+    ) -> List[List[float]]:
+        """
+        Embed a list of inputs with a single async request, bounded by the shared semaphore.
+        Inputs whose cache key is found in the embedding cache are not sent. Fresh embeddings
+        are only written back to the cache when persist is set.
+        """
+        keys = cache_keys if cache_keys is not None else []
+        results, missing = self._cache_lookup(keys) if keys else ([None] * len(inputs), list(range(len(inputs))))
+        if not missing:
+            return results
+
+        response = await self._acreate_embeddings(
+            client,
+            retry_policy,
+            input=[inputs[i] for i in missing],
+            model=model,
+            encoding_format="float",
+            extra_body=extra_body
+        )
+        fresh = [d.embedding for d in response.data]
+        if not keys:
+            return fresh
+        return self._cache_store(keys, results, missing, fresh, persist)
+
+    @staticmethod
+    def _create_embeddings(client: OpenAI, retry_policy: Dict[str, Any], **kwargs: Any) -> Any:
+        """
+        Send one embeddings request, retrying rate limits, connection errors and server errors
+        as configured by retry_policy (EMBED_RETRY or QUERY_EMBED_RETRY).
+        """
+        return Retrying(**retry_policy)(client.embeddings.create, **kwargs)
+
+    async def _acreate_embeddings(self, client: AsyncOpenAI, retry_policy: Dict[str, Any], **kwargs: Any) -> Any:
+        """
+        Async version of _create_embeddings. The semaphore is only held while the request
+        is in flight, so backoff sleeps do not block other batches.
+        """
+        async for attempt in AsyncRetrying(**retry_policy):
+            with attempt:
+                async with self._embed_semaphore:
+                    return await client.embeddings.create(**kwargs)
+
+    def _text_cache_keys(self, chunks: List[str], query_type: str) -> List[bytes]:
+        """
+        Cache keys for text chunks. The input type is part of the key since E5 embeds queries and passages differently.
+        """
+        return [EmbeddingCache.make_key(self.text_model_name, query_type, chunk) for chunk in chunks]
+
+    def _image_cache_keys(self, images: List[str]) -> List[bytes]:
+        """
+        Cache keys for base64 images, hashed on the decoded image bytes.
+        """
+        return [EmbeddingCache.make_key(self.image_model_name, "image", base64_image_bytes(image)) for image in images]
+
+    def _cache_lookup(self, keys: List[bytes]) -> Tuple[List[Any], List[int]]:
+        """
+        Return the cached embeddings for the given keys (None when missing) and the indices that still need embedding.
+        """
+        if self.embedding_cache is None:
+            return [None] * len(keys), list(range(len(keys)))
+        results = self.embedding_cache.get_many(keys)
+        missing = [i for i, vec in enumerate(results) if vec is None]
+        return results, missing
+
+    def _cache_store(
+        self,
+        keys: List[bytes],
+        results: List[Any],
+        missing: List[int],
+        fresh: List[List[float]],
+        persist: bool = True
+    ) -> List[Any]:
+        """
+        Slot freshly computed embeddings into the results list and, when persist is set, write them to the cache.
+        """
+        for i, vec in zip(missing, fresh):
+            results[i] = vec
+        if persist and self.embedding_cache is not None:
+            self.embedding_cache.put_many([(keys[i], vec) for i, vec in zip(missing, fresh)])
+        return results
 
     def text_embeddings(
         self,
         texts: List[str],
         query_type: str = "query",
         verbose: bool = False
-    ) -> List[List[float] | None]:
+    ) -> List[np.ndarray | None]:
         """
         Generate text embeddings from a list of text strings, using chunking and batching.
         """
@@ -202,87 +666,189 @@ class Retriever:
         if not all_chunks:
             return [None] * len(texts)
 
-        all_chunk_embeddings = self._embed_chunks_in_batches(all_chunks, query_type, verbose)
+        # Identical chunks (e.g. repeated category tails) are only embedded once, in length order.
+        unique_chunks, chunk_index = self._dedupe_chunks(all_chunks)
+        unique_embeddings = self._embed_chunks_in_batches(unique_chunks, query_type, verbose)
+        all_chunk_embeddings = [unique_embeddings[i] for i in chunk_index]
         
         final_embeddings = self._reconstruct_embeddings(texts, all_chunk_embeddings, text_chunk_counts)
         
         return final_embeddings
 
+    async def atext_embeddings(
+        self,
+        texts: List[str],
+        query_type: str = "query",
+        verbose: bool = False
+    ) -> List[np.ndarray | None]:
+        """
+        Async version of text_embeddings that sends all chunk batches concurrently.
+        """
+        if not texts:
+            return []
+
+        all_chunks, text_chunk_counts = self._create_text_chunks(texts, verbose)
+        if not all_chunks:
+            return [None] * len(texts)
+
+        # Identical chunks (e.g. repeated category tails) are only embedded once, in length order.
+        unique_chunks, chunk_index = self._dedupe_chunks(all_chunks)
+        unique_embeddings = await self._aembed_chunks_in_batches(unique_chunks, query_type, verbose)
+        all_chunk_embeddings = [unique_embeddings[i] for i in chunk_index]
+
+        return self._reconstruct_embeddings(texts, all_chunk_embeddings, text_chunk_counts)
+
     def _create_text_chunks(self, texts: List[str], verbose: bool = False) -> Tuple[List[str], List[int]]:
         """
         Break all input texts into smaller chunks and return the chunks and their counts.
         """
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
         all_chunks = []
         text_chunk_counts = []
         for text in texts:
-            chunks = text_splitter.split_text(text)
+            if len(text) <= TEXT_CHUNK_SIZE:
+                # Short texts (most catalog rows) are a single chunk, which is what the splitter returns for them.
+                stripped = text.strip()
+                chunks = [stripped] if stripped else []
+            else:
+                chunks = self.text_splitter.split_text(text)
             all_chunks.extend(chunks)
             text_chunk_counts.append(len(chunks))
         if verbose:
-            logging.info(f"CATALOG RETRIEVER | Retriever.text_embeddings() | Created {len(all_chunks)} chunks from {len(texts)} texts.")
+            logger.info("CATALOG RETRIEVER | Retriever.text_embeddings() | Created %s chunks from %s texts.", len(all_chunks), len(texts))
         return all_chunks, text_chunk_counts
 
+    @staticmethod
+    def _dedupe_chunks(all_chunks: List[str]) -> Tuple[List[str], List[int]]:
+        """
+        Return the unique chunks ordered by length and, for every input chunk, its index in that list.
+        The embedding NIM pads each batch to its longest input, so batching similar lengths together
+        wastes less compute on padding.
+        """
+        unique_chunks = sorted(dict.fromkeys(all_chunks), key=len)
+        positions = {chunk: i for i, chunk in enumerate(unique_chunks)}
+        return unique_chunks, [positions[chunk] for chunk in all_chunks]
+
     def _embed_chunks_in_batches(
         self,
         all_chunks: List[str],
         query_type: str,
         verbose: bool = False,
-        batch_size: int = 32
+        batch_size: int = EMBED_BATCH_SIZE
     ) -> List[List[float] | None]:
         """
-        Embed all created chunks in efficient batches.
+        Embed all created chunks in efficient batches, running the batches on the embedding worker pool.
         """
-        all_chunk_embeddings = []
-        num_batches = (len(all_chunks) + batch_size - 1) // batch_size
-        for i in range(0, len(all_chunks), batch_size):
-            batch_chunks = all_chunks[i:i + batch_size]
-            if verbose:
-                logging.info(f"CATALOG RETRIEVER | Retriever.text_embeddings() | Processing text chunk batch {i//batch_size + 1}/{num_batches} with {len(batch_chunks)} chunks.")
+        def embed_batch(batch_chunks: List[str]) -> List[List[float] | None]:
+            try:
+                return self._embed_batch(batch_chunks, query_type)
+            except Exception as e:
+                logger.error("CATALOG RETRIEVER | Retriever.text_embeddings() | Error embedding chunk batch, dropping %d chunk(s): %s", len(batch_chunks), e)
+                return [None for _ in batch_chunks]
+
+        batches = [all_chunks[i:i + batch_size] for i in range(0, len(all_chunks), batch_size)]
+        if verbose:
+            logger.info("CATALOG RETRIEVER | Retriever.text_embeddings() | Embedding %s chunks in %s batches.", len(all_chunks), len(batches))
+        if len(batches) == 1:
+            return embed_batch(batches[0])
+        results = self._embed_executor.map(embed_batch, batches)
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
+
+    async def _aembed_chunks_in_batches(
+        self,
+        all_chunks: List[str],
+        query_type: str,
+        verbose: bool = False,
+        batch_size: int = EMBED_BATCH_SIZE
+    ) -> List[List[float] | None]:
+        """
+        Embed all created chunks, issuing the batches concurrently.
+        """
+        async def embed_batch(batch_chunks: List[str]) -> List[List[float] | None]:
             try:
-                response = self.text_client.embeddings.create(
-                    input=batch_chunks,
-                    model=self.text_model_name,
-                    encoding_format="float",
-                    extra_body={"input_type": query_type, "truncate": "NONE"}
+                return await self._aembed_batch(
+                    self.text_client_async,
+                    self.text_model_name,
+                    batch_chunks,
+                    extra_body={"input_type": query_type, "truncate": "NONE"},
+                    cache_keys=self._text_cache_keys(batch_chunks, query_type)
                 )
-                all_chunk_embeddings.extend([d.embedding for d in response.data])
             except Exception as e:
-                if verbose:
-                    logging.error(f"CATALOG RETRIEVER | Retriever.text_embeddings() | Error embedding chunk batch: {e}")
-                all_chunk_embeddings.extend([None for _ in batch_chunks])
-        return all_chunk_embeddings
+                logger.error("CATALOG RETRIEVER | Retriever.atext_embeddings() | Error embedding chunk batch, dropping %d chunk(s): %s", len(batch_chunks), e)
+                return [None for _ in batch_chunks]
+
+        batches = [all_chunks[i:i + batch_size] for i in range(0, len(all_chunks), batch_size)]
+        if verbose:
+            logger.info("CATALOG RETRIEVER | Retriever.atext_embeddings() | Embedding %s chunks in %s concurrent batches.", len(all_chunks), len(batches))
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
 
     def _reconstruct_embeddings(
         self,
         texts: List[str],
         all_chunk_embeddings: List[List[float] | None],
         text_chunk_counts: List[int]
-    ) -> List[List[float] | None]:
+    ) -> List[np.ndarray | None]:
         """
-        Reconstruct a single embedding for each original text from chunk embeddings.
+        Reconstruct a single float32 embedding for each original text from chunk embeddings.
+        All chunks are copied once into a preallocated matrix and averaged per text with a
+        single segmented reduction, instead of stacking a new array for every text.
         """
-        final_embeddings = []
-        current_chunk_idx = 0
-        for i, text in enumerate(texts):
-            num_chunks = text_chunk_counts[i]
-            if num_chunks == 0:
-                final_embeddings.append(None)
-                continue
-
-            chunk_embeddings = all_chunk_embeddings[current_chunk_idx : current_chunk_idx + num_chunks]
-            current_chunk_idx += num_chunks
-
-            valid_chunk_embeddings = [emb for emb in chunk_embeddings if emb is not None]
+        first = next((emb for emb in all_chunk_embeddings if emb is not None), None)
+        if first is None:
+            return [None] * len(texts)
 
-            if valid_chunk_embeddings:
-                average_embedding = list(mean(valid_chunk_embeddings, axis=0))
-                final_embeddings.append(average_embedding)
-            else:
-                final_embeddings.append(None)
+        # Failed chunks stay as zero rows and are left out of the per-text counts.
+        chunk_matrix = np.zeros((len(all_chunk_embeddings), len(first)), dtype=np.float32)
+        valid = np.zeros(len(all_chunk_embeddings), dtype=np.float32)
+        for i, emb in enumerate(all_chunk_embeddings):
+            if emb is not None:
+                chunk_matrix[i] = emb
+                valid[i] = 1.0
+
+        if len(all_chunk_embeddings) == len(texts) and all(count == 1 for count in text_chunk_counts):
+            # Every text is a single chunk, so there is nothing to average.
+            return [chunk_matrix[i] if valid[i] else None for i in range(len(texts))]
+
+        counts = np.asarray(text_chunk_counts, dtype=np.intp)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # reduceat needs non-empty segments, so texts without chunks are left out.
+        has_chunks = np.flatnonzero(counts > 0)
+        starts = offsets[has_chunks]
+        sums = np.add.reduceat(chunk_matrix, starts, axis=0)
+        valid_counts = np.add.reduceat(valid, starts)
+
+        final_embeddings: List[np.ndarray | None] = [None] * len(texts)
+        for row, text_idx in enumerate(has_chunks):
+            if valid_counts[row] > 0:
+                final_embeddings[text_idx] = sums[row] / valid_counts[row]
         
         return final_embeddings
 
+    def _embed_image_batch(
+        self,
+        images: List[str],
+        retry_policy: Dict[str, Any] = EMBED_RETRY,
+        persist: bool = True
+    ) -> List[List[float]]:
+        """
+        Embed a list of base64 images with a single request to the image embedding NIM.
+        Images found in the embedding cache are not sent, and fresh embeddings are only
+        written back to it when persist is set.
+        """
+        keys = self._image_cache_keys(images)
+        results, missing = self._cache_lookup(keys)
+        if not missing:
+            return results
+
+        response = self._create_embeddings(
+            self.image_client,
+            retry_policy,
+            input=[images[i] for i in missing],
+            model=self.image_model_name,
+            encoding_format="float",
+        )
+        return self._cache_store(keys, results, missing, [d.embedding for d in response.data], persist)
+
     def image_embeddings(
         self,
         texts: List[str],
@@ -290,91 +856,149 @@ class Retriever:
     ) -> List[List[float] | None]:
         """
         Generate image embeddings from a list of base64 image strings or image URLs using batching.
+        Batches run on the embedding worker pool.
         Returns a list of embeddings, with None for failures, to maintain 1:1 mapping with input.
         """
-        all_embeddings = []
-        batch_size = 32
-        num_batches = (len(texts) + batch_size - 1) // batch_size
+        batch_size = EMBED_BATCH_SIZE
 
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i:i + batch_size]
+        def embed_batch(batch_texts: List[str]) -> List[List[float] | None]:
+            input_data_list = list(self._image_executor.map(lambda text: self._prepare_image_input(text, verbose), batch_texts))
+            valid_inputs = [data for data in input_data_list if data is not None]
 
-            if verbose:
-                logging.info(f"CATALOG RETRIEVER | Retriever.image_embeddings() | Processing image batch {i//batch_size + 1}/{num_batches} with {len(batch_texts)} images.")
-            
-            input_data_list = []
-            
-            for text in batch_texts:
-                try:
-                    input_data = text
-                    if is_url(text):
-                        input_data = image_url_to_base64(text)
-                    elif is_path(text):
-                        input_data = image_path_to_base64(text)
-
-                    MAX_VARCHAR_LENGTH = 65535
-                    if len(input_data) > MAX_VARCHAR_LENGTH:
-                        if verbose:
-                            logging.info(f"CATALOG RETRIEVER | Image too large ({len(input_data)} bytes), resizing...")
-                        # Try to resize the image
-                        resized = resize_base64_image(input_data)
-                        if resized and len(resized) <= MAX_VARCHAR_LENGTH:
-                            input_data = resized
-                            if verbose:
-                                logging.info(f"CATALOG RETRIEVER | Image resized successfully to {len(input_data)} bytes")
-                        else:
-                            if verbose:
-                                logging.warning(f"CATALOG RETRIEVER | Failed to resize image or still too large after resize")
-                            input_data = None 
-                except Exception as e:
-                    if verbose:
-                        logging.error(f"CATALOG RETRIEVER | Error processing image for batching: {e}")
-                    input_data = None
-                input_data_list.append(input_data)
+            try:
+                batch_embeddings = self._embed_image_batch(valid_inputs) if valid_inputs else []
+            except Exception as e:
+                self._log_image_batch_error(e)
+                batch_embeddings = []
 
+            return self._merge_image_batch(input_data_list, batch_embeddings)
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if verbose:
+            logger.info("CATALOG RETRIEVER | Retriever.image_embeddings() | Embedding %s images in %s batches.", len(texts), len(batches))
+        if len(batches) == 1:
+            return embed_batch(batches[0])
+        results = self._embed_executor.map(embed_batch, batches)
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
+
+    async def aimage_embeddings(
+        self,
+        texts: List[str],
+        verbose: bool = False
+    ) -> List[List[float] | None]:
+        """
+        Async version of image_embeddings that sends all image batches concurrently.
+        """
+        batch_size = EMBED_BATCH_SIZE
+
+        async def embed_batch(batch_texts: List[str]) -> List[List[float] | None]:
+            # Downloading and resizing images is blocking work, keep it off the event loop
+            # and fetch the images of a batch in parallel.
+            loop = asyncio.get_running_loop()
+            input_data_list = await asyncio.gather(
+                *(loop.run_in_executor(self._image_executor, self._prepare_image_input, text, verbose) for text in batch_texts)
+            )
             valid_inputs = [data for data in input_data_list if data is not None]
-            
             try:
-                if valid_inputs:
-                    response = self.image_client.embeddings.create(
-                        input=valid_inputs,
-                        model=self.image_model_name,
-                        encoding_format="float",
-                    )
-                    batch_embeddings = iter([d.embedding for d in response.data])
-                else:
-                    batch_embeddings = iter([])
-
+                batch_embeddings = await self._aembed_batch(
+                    self.image_client_async,
+                    self.image_model_name,
+                    valid_inputs,
+                    cache_keys=self._image_cache_keys(valid_inputs)
+                ) if valid_inputs else []
             except Exception as e:
+                self._log_image_batch_error(e)
+                batch_embeddings = []
+            return self._merge_image_batch(input_data_list, batch_embeddings)
+
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if verbose:
+            logger.info("CATALOG RETRIEVER | Retriever.aimage_embeddings() | Embedding %s images in %s concurrent batches.", len(texts), len(batches))
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
+
+    def _prepare_image_input(self, text: str, verbose: bool = False, persist: bool = True) -> str | None:
+        """
+        Convert an image reference (URL, path or base64) into a base64 string that fits in Milvus.
+        Downloads are only kept in the embedding cache when persist is set.
+        Returns None if the image could not be prepared.
+        """
+        try:
+            input_data = text
+            # Inline data URIs are the common case for query images; skip classifying them.
+            if text.startswith("data:"):
+                pass
+            elif is_url(text):
+                input_data = self._download_image(text, persist)
+            elif is_path(text):
+                input_data = image_path_to_base64(text)
+
+            MAX_VARCHAR_LENGTH = 65535
+            if len(input_data) > MAX_VARCHAR_LENGTH:
                 if verbose:
-                    error_msg = str(e)
-                    if "webp" in error_msg.lower():
-                        logging.error(f"CATALOG RETRIEVER | Unsupported image format detected (WebP). Only JPEG and PNG are supported: {e}")
-                    elif "format" in error_msg.lower() or "expected" in error_msg.lower():
-                        logging.error(f"CATALOG RETRIEVER | Image format error. Only JPEG and PNG are supported: {e}")
-                    else:
-                        logging.error(f"CATALOG RETRIEVER | Retriever.image_embeddings() | Error embedding image batch: {e}")
-                batch_embeddings = iter([])
-
-            # Reconstruct the batch with Nones for failed embeddings
-            reconstructed_batch = []
-            for data in input_data_list:
-                if data is not None:
-                    try:
-                        embedding = next(batch_embeddings)
-                        reconstructed_batch.append(embedding)
-                    except StopIteration:
-                        # If we run out of embeddings, add None for remaining items
-                        reconstructed_batch.append(None)
+                    logger.debug("CATALOG RETRIEVER | Image too large (%d bytes), resizing...", len(input_data))
+                # Try to resize the image
+                resized = resize_base64_image(input_data)
+                if resized and len(resized) <= MAX_VARCHAR_LENGTH:
+                    input_data = resized
+                    if verbose:
+                        logger.debug("CATALOG RETRIEVER | Image resized successfully to %d bytes", len(input_data))
                 else:
-                    reconstructed_batch.append(None)
-            all_embeddings.extend(reconstructed_batch)
+                    if verbose:
+                        logger.warning("CATALOG RETRIEVER | Failed to resize image or still too large after resize")
+                    input_data = None 
+        except Exception as e:
+            if verbose:
+                logger.error("CATALOG RETRIEVER | Error processing image for batching: %s", e)
+            input_data = None
+        return input_data
 
-        return all_embeddings
+    def _download_image(self, url: str, persist: bool = True) -> str | None:
+        """
+        Download an image URL as base64, reusing the copy kept in the embedding cache when there is one.
+        New downloads are only stored in the cache when persist is set.
+        """
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get_download(url)
+            if cached is not None:
+                return cached
+        input_data = image_url_to_base64(url)
+        if persist and input_data is not None and self.embedding_cache is not None:
+            self.embedding_cache.put_download(url, input_data)
+        return input_data
 
+    @staticmethod
+    def _merge_image_batch(
+        input_data_list: List[str | None],
+        batch_embeddings: List[List[float]]
+    ) -> List[List[float] | None]:
+        """
+        Reconstruct a batch with Nones for inputs that could not be prepared or embedded.
+        """
+        embeddings_iter = iter(batch_embeddings)
+        reconstructed_batch = []
+        for data in input_data_list:
+            if data is not None:
+                # If we run out of embeddings, add None for remaining items
+                reconstructed_batch.append(next(embeddings_iter, None))
+            else:
+                reconstructed_batch.append(None)
+        return reconstructed_batch
 
+    @staticmethod
+    def _log_image_batch_error(e: Exception) -> None:
+        """
+        Log an image batch embedding failure with a hint about unsupported formats.
+        """
+        error_msg = str(e)
+        if "webp" in error_msg.lower():
+            logger.error("CATALOG RETRIEVER | Unsupported image format detected (WebP). Only JPEG and PNG are supported: %s", e)
+        elif "format" in error_msg.lower() or "expected" in error_msg.lower():
+            logger.error("CATALOG RETRIEVER | Image format error. Only JPEG and PNG are supported: %s", e)
+        else:
+            logger.error("CATALOG RETRIEVER | Retriever.image_embeddings() | Error embedding image batch: %s", e)
 
-    def milvus_from_csv(self, csv_path: str, verbose: bool = False) -> None:
+    async def milvus_from_csv(self, csv_path: str, verbose: bool = False) -> None:
         """
         Fills the milvus database with the data from a CSV file.
         Only populates if embeddings don't already exist.
@@ -382,64 +1006,152 @@ class Retriever:
 
         # Check if embeddings already exist
         if self.embeddings_exist():
-            logging.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Embeddings already exist, skipping population.")
+            logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Embeddings already exist, skipping population.")
             return
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | No embeddings found, populating from: '{csv_path}'")
+        logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | No embeddings found, populating from: '%s'", csv_path)
 
-        # Get our pd dataframe
+        # Stream the CSV in windows of rows, so memory stays bounded regardless of catalog size
         try:
-            df = pd.read_csv(csv_path)
-            logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | CSV read in.")
+            reader = pd.read_csv(csv_path, chunksize=INGEST_BATCH_ROWS)
+            logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | CSV opened.")
         except Exception as e:
-            logging.debug(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | Error: {e} -- Failed to read CSV: {csv_path}.")            
+            logger.debug("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Error: %s -- Failed to read CSV: %s.", e, csv_path)
             dir_contents = []
             for entry in os.listdir("."):
                 dir_contents.append(entry)
-            logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | Directory contents at failure: {dir_contents}")
+            logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Directory contents at failure: %s", dir_contents)
 
-        # Create combined name and description strings
-        metadatas = df.to_dict(orient="records")
-        combined_texts = [f"{name} | {desc} | {category},{subcategory}" for name, desc, category, subcategory in zip(df["name"].tolist(), df["description"].tolist(), df["category"].tolist(), df["subcategory"].tolist())]
-        
-        # Embed the combined name and description fields
-        text_embs = self.text_embeddings(combined_texts,query_type="passage",verbose=verbose)
+        # Embed and insert the catalog in windows of rows. Embedding of the next window overlaps
+        # with the Milvus insert of the current one, and the bounded queue caps memory at a few windows.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=INGEST_QUEUE_SIZE)
 
-        # Filter out failed embeddings and their corresponding metadata
-        successful_texts_data = [
-            (text, emb, meta) for text, emb, meta in zip(combined_texts, text_embs, metadatas) if emb is not None
-        ]
-        if successful_texts_data:
-            successful_texts, successful_text_embs, successful_text_metadatas = zip(*successful_texts_data)
-            self.text_db.add_embeddings(
-                texts=list(successful_texts),
-                embeddings=list(successful_text_embs),
-                metadatas=list(successful_text_metadatas)
-            )
+        async def produce() -> None:
+            try:
+                # Parsing the next window runs off the event loop, overlapping with embedding requests in flight.
+                while (window := await asyncio.to_thread(next, reader, None)) is not None:
+                    # Create combined name and description strings for the window in one vectorized pass
+                    combined_texts = (
+                        window["name"].astype(str) + " | " + window["description"].astype(str) + " | "
+                        + window["category"].astype(str) + "," + window["subcategory"].astype(str)
+                    ).tolist()
+
+                    # CSV row numbers, used to report rows that could not be embedded.
+                    row_ids = window.index.tolist()
+                    # Metadata stays columnar, matching the column-based Milvus inserts
+                    metadatas = {column: window[column].tolist() for column in window.columns}
+                    images = metadatas["image"]
+
+                    # Embed the combined name and description fields and the image field of each row concurrently
+                    text_embs, image_embs = await asyncio.gather(
+                        self.atext_embeddings(combined_texts, query_type="passage", verbose=verbose),
+                        self.aimage_embeddings(images, verbose=verbose)
+                    )
+                    await queue.put((row_ids, combined_texts, images, metadatas, text_embs, image_embs))
+            finally:
+                await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        self._result_cache.clear()
+        total_texts = inserted_texts = total_images = inserted_images = 0
+        try:
+            while (item := await queue.get()) is not None:
+                row_ids, combined_texts, images, metadatas, text_embs, image_embs = item
+                self._log_dropped_rows(self.text_collection, row_ids, text_embs)
+                self._log_dropped_rows(self.image_collection, row_ids, image_embs)
+                total_texts += len(combined_texts)
+                total_images += len(images)
+                # The two collections are written in parallel.
+                window_texts, window_images = await asyncio.gather(
+                    self._insert_embeddings(self.text_db, combined_texts, text_embs, metadatas),
+                    self._insert_embeddings(self.image_db, images, image_embs, metadatas)
+                )
+                inserted_texts += window_texts
+                inserted_images += window_images
+                if verbose:
+                    logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Inserted %s/%s text rows and %s/%s image rows so far.", inserted_texts, total_texts, inserted_images, total_images)
+                del item, row_ids, combined_texts, images, metadatas, text_embs, image_embs
+            await producer
+        finally:
+            producer.cancel()
+            reader.close()
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | Text embeddings obtained.")   
+        # Seal the inserted segments once at the end rather than per window.
+        await asyncio.gather(*(
+            asyncio.to_thread(db.col.flush) for db in (self.text_db, self.image_db) if db.col is not None
+        ))
 
-        # Embed the image field of each row
-        image_embs = self.image_embeddings(df["image"].tolist(), verbose=verbose)
+        logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Text embeddings obtained. Total texts: %s, Failed embeddings: %s", total_texts, total_texts - inserted_texts)
+        logger.info("CATALOG RETRIEVER | Retriever.milvus_from_csv() | Image embeddings obtained. Total images: %s, Failed embeddings: %s", total_images, total_images - inserted_images)
 
-        # Log the number of total and failed image embeddings
-        total_images = len(df["image"].tolist())
-        failed_image_embeddings = total_images - len([e for e in image_embs if e is not None])
-        logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | Total images: {total_images}, Failed embeddings: {failed_image_embeddings}")
+    @staticmethod
+    def _log_dropped_rows(collection: str, row_ids: List[int], embeddings: List[Any]) -> None:
+        """
+        Log the CSV rows left out of a collection because their embedding failed permanently.
+        """
+        dropped = [row for row, emb in zip(row_ids, embeddings) if emb is None]
+        if dropped:
+            logger.error(
+                "CATALOG RETRIEVER | Retriever.milvus_from_csv() | Dropping %d row(s) from '%s', embedding failed for CSV rows: %s",
+                len(dropped), collection, dropped
+            )
 
+    async def _insert_embeddings(
+        self,
+        db: Milvus,
+        texts: List[str],
+        embeddings: List[Any],
+        metadatas: Dict[str, List[Any]]
+    ) -> int:
+        """
+        Insert the rows whose embedding succeeded into a Milvus collection.
+        metadatas maps each metadata column to its values, aligned with texts.
+        Returns the number of inserted rows.
+        """
         # Filter out failed embeddings and their corresponding metadata
-        successful_images_data = [
-            (img_ref, emb, meta) for img_ref, emb, meta in zip(df["image"].tolist(), image_embs, metadatas) if emb is not None
-        ]
-        if successful_images_data:
-            successful_images, successful_image_embs, successful_image_metadatas = zip(*successful_images_data)
-            self.image_db.add_embeddings(
-                texts=list(successful_images),
-                embeddings=list(successful_image_embs),
-                metadatas=list(successful_image_metadatas)
-            )
+        keep = [i for i, emb in enumerate(embeddings) if emb is not None]
+        if not keep:
+            return 0
+        dtype = self._vector_np_dtype(db)
+        texts = [texts[i] for i in keep]
+        # Store unit vectors, normalized in one pass over the stacked window. Cosine ranking is
+        # unchanged, and float16 storage keeps its full precision for unit-range values.
+        matrix = l2_normalize(np.asarray([embeddings[i] for i in keep], dtype=np.float32))
+        vectors = list(matrix.astype(dtype, copy=False))
+        if len(keep) < len(embeddings):
+            metadatas = {column: [values[i] for i in keep] for column, values in metadatas.items()}
+
+        if db.col is None:
+            # The first insert goes through the LangChain wrapper, which creates the collection,
+            # its schema and its index from the first rows.
+            rows = [dict(zip(metadatas, values)) for values in zip(*metadatas.values())]
+            await asyncio.to_thread(db.add_embeddings, texts=texts, embeddings=vectors, metadatas=rows)
+        else:
+            # Later inserts go straight to pymilvus as columns, skipping the per-row dicts the wrapper builds.
+            await asyncio.to_thread(db.col.insert, self._insert_columns(db, texts, vectors, metadatas))
+        return len(keep)
 
-        logging.info(f"CATALOG RETRIEVER | Retriever.milvus_from_csv() | Image embeddings obtained.") 
+    @staticmethod
+    def _insert_columns(
+        db: Milvus,
+        texts: List[str],
+        vectors: List[np.ndarray],
+        metadatas: Dict[str, List[Any]]
+    ) -> List[List[Any]]:
+        """
+        Arrange texts, vectors and metadata columns in the field order of the collection schema.
+        """
+        columns = []
+        for field in db.col.schema.fields:
+            if field.is_primary and field.auto_id:
+                continue
+            if field.name == TEXT_FIELD:
+                columns.append(texts)
+            elif field.name == VECTOR_FIELD:
+                columns.append(vectors)
+            else:
+                columns.append(metadatas[field.name])
+        return columns
 
     async def retrieve(
         self,
@@ -453,7 +1165,54 @@ class Retriever:
     ) -> Tuple[List[str], List[str], List[float], List[str], List[str]]:
         """
         Asynchronously retrieve relevant items from both text and image databases.
+        Identical requests within RESULT_CACHE_TTL seconds are answered from the result cache.
         """
+        key = self._result_cache_key(query, categories, filters, image, k, image_bool)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            if verbose:
+                logger.info("CATALOG RETRIEVER | retrieve() | Result cache hit.")
+            return tuple(list(column) for column in cached)
+
+        results = await self._retrieve(query, categories, filters, image, k, image_bool, verbose)
+        self._result_cache.put(key, tuple(tuple(column) for column in results))
+        return results
+
+    @staticmethod
+    def _result_cache_key(
+        query: List[str],
+        categories: List[str],
+        filters: Dict[str, Any] | None,
+        image: str,
+        k: int,
+        image_bool: bool
+    ) -> Tuple[Any, ...]:
+        """
+        Result cache key for a retrieve request. The image is hashed so base64 payloads are not kept as keys.
+        """
+        image_hash = hashlib.blake2b(image.encode("utf-8"), digest_size=16).digest() if image_bool else b""
+        filters_key = tuple(sorted((name, repr(value)) for name, value in filters.items())) if filters else ()
+        return (tuple(query), tuple(categories), filters_key, image_hash, k, image_bool)
+
+    async def _retrieve(
+        self,
+        query: List[str],
+        categories: List[str],
+        filters: Dict[str, Any] | None,
+        image: str,
+        k: int,
+        image_bool: bool,
+        verbose: bool
+    ) -> Tuple[List[str], List[str], List[float], List[str], List[str]]:
+        """
+        Search both collections, then rank and filter the results. Called by retrieve on a cache miss.
+        """
+        # Text search results are filtered by category, so without categories nothing can match.
+        # Return before embedding or searching anything.
+        if not image_bool and not categories:
+            if verbose:
+                logger.info("CATALOG RETRIEVER | No categories provided for text search, returning empty.")
+            return [], [], [], [], []
 
         # Check if our query is blank. If it is, replace it with dummy text.
         local_queries = query
@@ -462,183 +1221,279 @@ class Retriever:
 
         if image_bool:
             if verbose:
-                logging.info("CATALOG RETRIEVER | retrieve() | Performing dual retrieval for image input.")
-
-            # Use asyncio.gather for concurrency
-            t2t_tasks = []
-            for local_query in local_queries:
-                if verbose:
-                    logging.info(f"\t| retrieve() | Checking query: {local_query}.")
-                t2t_tasks.append(asyncio.to_thread(self.text_db.similarity_search_with_relevance_scores, local_query, k=k))
-            if verbose:
-                logging.info("CATALOG RETRIEVER | retrieve() | Started text task.")
+                logger.info("CATALOG RETRIEVER | retrieve() | Performing dual retrieval for image input.")
+                logger.debug("\t| retrieve() | Checking queries: %s.", local_queries)
             base64_string = image.replace("data:application/octet-stream", "data:image/jpeg")
             if verbose:
-                logging.info(f"CATALOG RETRIEVER | retrieve() | Starting image task...\n\t| {base64_string[:100]}")
+                logger.info("CATALOG RETRIEVER | retrieve() | Starting image task...\n\t| %.100s", base64_string)
+            # All text queries go out as one multi-vector search, alongside the image search.
+            text_results, image_results = await asyncio.gather(
+                self._asearch_texts(local_queries, k=k, filters=filters),
+                self._asearch_image(base64_string, k=k*len(local_queries), filters=filters)
+            )
+            result_lists = [*text_results, image_results]
+        else:
             if verbose:
-                logging.info(f"CATALOG RETRIEVER | retrieve() | Obtained embedding...")
-            i2i_task = asyncio.to_thread(self.image_db.similarity_search_with_relevance_scores, base64_string, k=k*len(query))
+                logger.info("CATALOG RETRIEVER | retrieve() | Text-only retrieval. Queries: %s", local_queries)
+            result_lists = await self._asearch_texts(local_queries, k=k*len(local_queries), filters=filters)
+
+        # Image search ranks text and image hits together by similarity; text-only search interleaves per query.
+        all_results = self._merge_results(result_lists, by_score=image_bool, verbose=verbose)
+
+        if verbose and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                """CATALOG RETRIEVER | retrieve() | All retrieved results length. %d
+                            \n\t| Similarities: %s
+                            \n\t| Names: %s""",
+                len(all_results), [res[1] for res in all_results], [res[0].metadata['name'] for res in all_results]
+            )
 
-            unformatted_results = await asyncio.gather(*t2t_tasks, i2i_task)
-        else:
+        # Keep the highest-ranked top-k first, then apply explicit filters to that window.
+        # Threshold and ordering are done in one vectorized pass over the window's similarities.
+        ranked_window = all_results[:k]
+        window_sims = np.fromiter((res[1] for res in ranked_window), dtype=np.float32, count=len(ranked_window))
+        above_threshold = np.flatnonzero(window_sims > self.sim_threshold)
+        order = above_threshold[np.argsort(-window_sims[above_threshold], kind="stable")]
+        ranked_results = [ranked_window[i] for i in order]
+        ranked_results = self._apply_structured_filters(
+            ranked_results,
+            filters=filters,
+            verbose=verbose
+        )
+        ranked_results = ranked_results[:k]
+
+        if verbose:
+            logger.info("CATALOG RETRIEVER | retrieve() | Ranked window after threshold+filters: %d", len(ranked_results))
+
+        if verbose and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "CATALOG RETRIEVER | retrieve() | \n\tnames: %s \n\tsimilarities: %s",
+                [doc.metadata['name'] for doc, _ in ranked_results], [sim for _, sim in ranked_results]
+            )
+
+        # For image searches, ALWAYS return all results without category filtering
+        # Image similarity should determine relevance, not predefined categories
+        if image_bool:
             if verbose:
-                logging.info(f"CATALOG RETRIEVER | retrieve() | Text-only retrieval. Queries: {local_queries}")
+                logger.info("CATALOG RETRIEVER | Image search - returning all similarity-based results without category filtering")
+            return self._format_results(ranked_results)
 
-            results  = []
-            for local_query in local_queries:
-                if verbose:
-                    logging.info(f"\t| retrieve() | Launching text-only retrieval. Query type: {type(local_query)}, Query: {local_query}")
-                results.append(asyncio.to_thread(self.text_db.similarity_search_with_relevance_scores, local_query, k=k*len(query)))
-            unformatted_results = await asyncio.gather(*results)
+        # Categories are read from the stored metadata, parsing page_content only for rows without it.
+        cat_list = [self._product_categories(doc, doc.page_content, verbose) for doc, _ in ranked_results]
+        wanted = {user_cat.lower().strip() for user_cat in categories}
 
-        sorted_unformatted_results = []
-        for query_results in unformatted_results:
-            # Sort each list of (Document, score) tuples by the score in descending order
-            sorted_query_results = sorted(query_results, key=lambda item: item[1], reverse=True)
-            sorted_unformatted_results.append(sorted_query_results)
+        if verbose:
+            logger.info("CATALOG RETRIEVER | pre-category filtering:\n\tCategories: %s\n\tUser input: %s", cat_list, categories)
+
+        # Filter by category - check if any user category matches any product category/subcategory.
+        # Results are filtered before the response lists are built, so they are built only once.
+        filtered = [
+            result for result, cats in zip(ranked_results, cat_list)
+            if self._categories_match(wanted, cats)
+        ]
+
+        if not filtered:
+            if verbose:
+                logger.info("CATALOG RETRIEVER | No matches after category filtering.")
+            return [], [], [], [], []
 
         if verbose:
-            logging.info(f"""CATALOG RETRIEVER | retrieve() | Pre-interleaving data
-                            \n\t| Similarities: {[res[1] for sublist in sorted_unformatted_results for res in sublist]}
-                            \n\t| Names: {[res[0].metadata['name'] for sublist in sorted_unformatted_results for res in sublist]}""")
+            logger.info("CATALOG RETRIEVER | length of output items: %d", len(filtered))
+        return self._format_results(filtered)
 
-        # For image search, combine all results and sort by similarity instead of interleaving
-        if image_bool:
-            # Combine all results from different sources
-            all_unformatted_results = []
-            for sublist in sorted_unformatted_results:
-                all_unformatted_results.extend(sublist)
-            # Sort combined results by similarity score
-            interleaved_results = sorted(all_unformatted_results, key=lambda item: item[1], reverse=True)
+    @staticmethod
+    def _merge_results(
+        result_lists: List[List[Tuple[Document, float]]],
+        by_score: bool,
+        verbose: bool = False
+    ) -> List[Tuple[Document, float]]:
+        """
+        Merge per-search result lists into one list without duplicate products.
+        With by_score, all hits are ranked by similarity; otherwise the lists are
+        round-robin interleaved so every query contributes its best hits first.
+        """
+        # Sort each list of (Document, score) tuples by the score in descending order
+        sorted_lists = [sorted(results, key=lambda item: item[1], reverse=True) for results in result_lists]
+
+        if verbose and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                """CATALOG RETRIEVER | retrieve() | Pre-interleaving data
+                            \n\t| Similarities: %s
+                            \n\t| Names: %s""",
+                [res[1] for sublist in sorted_lists for res in sublist],
+                [res[0].metadata['name'] for sublist in sorted_lists for res in sublist]
+            )
+
+        if by_score:
+            merged = sorted(chain.from_iterable(sorted_lists), key=lambda item: item[1], reverse=True)
         else:
-            # For text-only search, use interleaving as before
-            interleaved_results = []
-            # Store them in a regular list
-            active_iterators = [iter(lst) for lst in sorted_unformatted_results] 
-            while active_iterators:
-                current_it = active_iterators.pop(0)
-                try:
-                    item = next(current_it)
-                    interleaved_results.append(item)
-                    active_iterators.append(current_it)
-                except StopIteration:
-                    pass
-                
+            merged = [item for item in chain.from_iterable(zip_longest(*sorted_lists)) if item is not None]
+
         # Deduplicate.
         seen_ids = set()
-        final_results = [] 
-        for res in interleaved_results:
-            pk_value = res[0].metadata.get("pk") 
-            id_ = str(pk_value) if pk_value is not None else None 
+        unique_results = []
+        for res in merged:
+            pk_value = res[0].metadata.get("pk")
+            id_ = str(pk_value) if pk_value is not None else None
             if id_ is not None and id_ not in seen_ids:
                 seen_ids.add(id_)
-                final_results.append(res)
-        
-        all_results = final_results
-
-        if verbose:
-            logging.info(f"""CATALOG RETRIEVER | retrieve() | All retrieved results length. {len(all_results)}
-                            \n\t| Similarities: {[res[1] for res in all_results]}
-                            \n\t| Names: {[res[0].metadata['name'] for res in all_results]}""")
+                unique_results.append(res)
+        return unique_results
 
-        # Keep the highest-ranked top-k first, then apply explicit filters to that window.
-        ranked_results = all_results[:k]
-        ranked_results = [res for res in ranked_results if res[1] > self.sim_threshold]
-        ranked_results = sorted(ranked_results, key=lambda item: item[1], reverse=True)
-        ranked_results = self._apply_structured_filters(
-            ranked_results,
-            filters=filters,
-            verbose=verbose
+    @staticmethod
+    def _categories_match(wanted: set, cats: List[str]) -> bool:
+        """
+        Whether any user category matches a product category or subcategory.
+        Exact matches are a set lookup. Otherwise fall back to a partial match
+        (e.g., "bag" matches "bags", "dress" matches "dresses").
+        """
+        return bool(wanted.intersection(cats)) or any(
+            user_cat in prod_cat or prod_cat in user_cat for user_cat in wanted for prod_cat in cats
         )
-        ranked_results = ranked_results[:k]
 
-        if verbose:
-            logging.info(
-                "CATALOG RETRIEVER | retrieve() | "
-                f"Ranked window after threshold+filters: {len(ranked_results)}"
+    @staticmethod
+    def _format_results(
+        results: List[Tuple[Document, float]]
+    ) -> Tuple[List[str], List[str], List[float], List[str], List[str]]:
+        """
+        Build the (texts, ids, sims, names, images) response lists in a single pass.
+        """
+        final_texts, final_ids, final_sims, final_names, final_images = [], [], [], [], []
+        for doc, sim in results:
+            metadata = doc.metadata
+            final_texts.append(f"{doc.page_content}\nPRICE: {metadata['price']}")
+            final_ids.append(str(metadata["pk"]))
+            final_sims.append(sim)
+            final_names.append(metadata['name'])
+            final_images.append(metadata['image'])
+        return final_texts, final_ids, final_sims, final_names, final_images
+
+    def _get_milvus_client_async(self) -> AsyncMilvusClient:
+        """
+        Return the async Milvus client, connecting on first use so it binds to the running event loop.
+        """
+        if self._milvus_client_async is None:
+            self._milvus_client_async = AsyncMilvusClient(uri=self.db_port)
+        return self._milvus_client_async
+
+    async def _asearch(
+        self,
+        db: Milvus,
+        vectors: List[List[float]],
+        k: int,
+        filters: Dict[str, Any] | None = None
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        Search a catalog collection for several vectors in one request with the native async Milvus client.
+        Price filters are applied by Milvus, so all k hits satisfy them.
+        Returns one list of (Document, relevance) pairs per vector, in the same shape and score scale as
+        Milvus.similarity_search_with_relevance_scores.
+        """
+        if db.col is None or k <= 0:
+            return [[] for _ in vectors]
+
+        output_fields = [field for field in db.fields if field in RESULT_FIELDS]
+        # Float16 collections take the queries as float16 arrays; float32 ones as plain lists.
+        dtype = self._vector_np_dtype(db)
+        data = [np.asarray(vector, dtype=dtype) for vector in vectors]
+        async with self._milvus_semaphore:
+            search_results = await self._get_milvus_client_async().search(
+                collection_name=db.collection_name,
+                data=data if dtype == np.float16 else [vector.tolist() for vector in data],
+                anns_field=VECTOR_FIELD,
+                # ef has to be at least the number of hits requested.
+                search_params={"metric_type": self._metric_type(db), "params": {"ef": max(SEARCH_EF, k)}},
+                limit=k,
+                output_fields=output_fields,
+                filter=self._price_filter_expr(db, filters),
             )
 
-        final_texts = [res[0].page_content + f"\nPRICE: {res[0].metadata['price']}" for res in ranked_results]
-        final_ids = [str(res[0].metadata["pk"]) for res in ranked_results]
-        final_sims = [res[1] for res in ranked_results]
-        final_names = [res[0].metadata['name'] for res in ranked_results]
-        final_images = [res[0].metadata['image'] for res in ranked_results]
+        all_results = []
+        for hits in search_results or [[] for _ in vectors]:
+            results = []
+            for hit in hits:
+                entity = dict(hit["entity"])
+                doc = Document(page_content=entity.pop(TEXT_FIELD, ""), metadata=entity)
+                # Map cosine similarity from [-1, 1] onto [0, 1], as the LangChain relevance scores do.
+                results.append((doc, (hit["distance"] + 1) / 2.0))
+            all_results.append(results)
+        return all_results
+
+    async def _asearch_texts(
+        self,
+        queries: List[str],
+        k: int,
+        filters: Dict[str, Any] | None = None
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        Embed text queries and search the text collection.
+        All queries are embedded in one NIM request and searched in one Milvus request.
+        """
+        vectors = await self._aembed_query_texts(queries)
+        return await self._asearch(self.text_db, vectors, k, filters)
 
-        if verbose:
-            logging.info(f"CATALOG RETRIEVER | retrieve() | \n\tnames: {final_names} \n\tsimilarities: {final_sims}")
+    async def _asearch_image(
+        self,
+        image: str,
+        k: int,
+        filters: Dict[str, Any] | None = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Embed a query image and search the image collection.
+        Runs alongside the text query tasks, so image and text embedding overlap.
+        """
+        vector = l2_normalize(np.array(await self._aembed_query_image(image), dtype=np.float32))
+        return (await self._asearch(self.image_db, [vector], k, filters))[0]
 
-        # Safely extract categories from texts
-        cat_list = []
-        for text in final_texts:
+    @staticmethod
+    def _product_categories(doc: Document, text: str, verbose: bool = False) -> List[str]:
+        """
+        Lowercased [category, subcategory] of a retrieved product.
+        Uses the metadata stored at ingestion, falling back to parsing the
+        "name | description | category,subcategory" text when it is missing.
+        """
+        metadata = doc.metadata
+        if "category" in metadata and "subcategory" in metadata:
+            parts = [str(metadata["category"]), str(metadata["subcategory"])]
+        else:
             try:
-                # Text format: "name | description | category,subcategory"
                 # Extract the last part after | and split by comma
                 category_part = text.split("|")[-1].strip()
                 if "PRICE:" in category_part:
                     # Handle malformed data where price info got mixed with category
                     category_part = category_part.split("PRICE:")[0].strip()
-                
-                # Split by comma to get [category, subcategory]
                 parts = category_part.split(",")
-                cats = []
-                for part in parts:
-                    cleaned = part.strip().lower()
-                    if cleaned and not cleaned.startswith("/"):  # Skip malformed data like "/images/..."
-                        cats.append(cleaned)
-                cat_list.append(cats)
             except Exception as e:
                 if verbose:
-                    logging.warning(f"CATALOG RETRIEVER | Error parsing category from: {text[:50]}... Error: {e}")
-                cat_list.append([])
-
-        if verbose:
-            logging.info(f"CATALOG RETRIEVER | pre-category filtering:\n\tCategories: {cat_list}\n\tUser input: {categories}")
+                    logger.warning("CATALOG RETRIEVER | Error parsing category from: %.50s... Error: %s", text, e)
+                return []
 
-        # For image searches, ALWAYS return all results without category filtering
-        # Image similarity should determine relevance, not predefined categories
-        if image_bool:
-            if verbose:
-                logging.info("CATALOG RETRIEVER | Image search - returning all similarity-based results without category filtering")
-            return final_texts, final_ids, final_sims, final_names, final_images
-        
-        # For text searches, if no categories provided, return empty
-        if not categories:
-            if verbose:
-                logging.info("CATALOG RETRIEVER | No categories provided for text search, returning empty.")
-            return [], [], [], [], []
+        cats = []
+        for part in parts:
+            cleaned = part.strip().lower()
+            if cleaned and not cleaned.startswith("/"):  # Skip malformed data like "/images/..."
+                cats.append(cleaned)
+        return cats
 
-        # Filter by category - check if any user category matches any product category/subcategory
-        filtered = []
-        for text, id_, sim, name, img, cats in zip(final_texts, 
-                                                   final_ids, 
-                                                   final_sims, 
-                                                   final_names, 
-                                                   final_images, 
-                                                   cat_list):
-            # Check if any user-provided category matches any product category/subcategory
-            match_found = False
-            for user_cat in categories:
-                user_cat_lower = user_cat.lower().strip()
-                for prod_cat in cats:
-                    # Check for partial match (e.g., "bag" matches "bags", "dress" matches "dresses")
-                    if user_cat_lower in prod_cat or prod_cat in user_cat_lower:
-                        match_found = True
-                        break
-                if match_found:
-                    break
-            
-            if match_found:
-                filtered.append((text, id_, sim, name, img))
-
-        if not filtered:
-            if verbose:
-                logging.info("CATALOG RETRIEVER | No matches after category filtering.")
-            return [], [], [], [], []
+    def _price_filter_expr(self, db: Milvus, filters: Dict[str, Any] | None) -> str:
+        """
+        Milvus boolean expression for the min_price/max_price filters, or "" when there is none.
+        Only used when the collection stores price as a numeric field.
+        """
+        if not filters or db.col is None:
+            return ""
+        price_field = next((field for field in db.col.schema.fields if field.name == "price"), None)
+        if price_field is None or price_field.dtype not in NUMERIC_DTYPES:
+            return ""
 
-        texts_out, ids_out, sims_out, names_out, images_out = zip(*filtered)
-        if verbose:
-            logging.info(f"CATALOG RETRIEVER | length of output items: {len(names_out)}")
-        return list(texts_out), list(ids_out), list(sims_out), list(names_out), list(images_out)
+        clauses = []
+        min_price = self._coerce_float(filters.get("min_price"))
+        max_price = self._coerce_float(filters.get("max_price"))
+        if min_price is not None:
+            clauses.append(f"price >= {min_price!r}")
+        if max_price is not None:
+            clauses.append(f"price <= {max_price!r}")
+        return " and ".join(clauses)
 
     @staticmethod
     def _coerce_float(value: Any) -> float | None:
@@ -663,6 +1518,8 @@ class Retriever:
     ) -> List[Tuple[Any, float]]:
         """
         Apply structured metadata filters before assembling final response payloads.
+        Milvus already applies price filters on collections with a numeric price field;
+        this keeps them exact for collections that store price as text.
         """
         if not filters:
             return results
@@ -686,9 +1543,9 @@ class Retriever:
             filtered_results.append(result)
 
         if verbose:
-            logging.info(
-                "CATALOG RETRIEVER | _apply_structured_filters() | "
-                f"filters={filters} | input={len(results)} | output={len(filtered_results)}"
+            logger.info(
+                "CATALOG RETRIEVER | _apply_structured_filters() | filters=%s | input=%d | output=%d",
+                filters, len(results), len(filtered_results)
             )
 
         return filtered_results
@@ -3,9 +3,8 @@
 
 from .agenttypes import Cart, State
 from .functions import add_to_cart_function, remove_from_cart_function, view_cart_function
-from openai import OpenAI
+from .llm_clients import get_openai
 from openai.types.chat import ChatCompletionMessageParam
-import os
 import json
 import logging
 import requests
@@ -25,6 +24,23 @@ def setup_logging():
 
 # Configuration will be loaded by the main application
 
+# Retry policy for catalog lookups, shared by every CartAgent session.
+CART_RETRY_STRATEGY = Retry(
+    total=3,
+    status_forcelist=[422, 429, 500, 502, 503, 504],
+    allowed_methods=["POST"],
+    backoff_factor=1
+)
+
+# Tools offered to the LLM on every cart request.
+CART_TOOLS = [add_to_cart_function, remove_from_cart_function, view_cart_function]
+
+# The cart system prompt never changes, so its message is built once.
+CART_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a retail agent that assists shoppers with their cart.\nOnly use the tools provided to help them."
+}
+
 class CartAgent():
     """
     CartAgent is an agent which manages a user's cart.
@@ -42,15 +58,14 @@ class CartAgent():
         
         # Store configuration
         self.memory_retriever_url = config.memory_port
-        self.model = OpenAI(base_url=config.llm_port, api_key=os.environ["LLM_API_KEY"])
+        self.model = get_openai(config.llm_port)
         self.catalog_retriever_port = config.retriever_port
         self.categories = config.categories
-        self.retry_strategy = Retry(
-                total=3,                    
-                status_forcelist=[422, 429, 500, 502, 503, 504],  
-                allowed_methods=["POST"],   
-                backoff_factor=1            
-            )
+        # Pooled session for catalog lookups, mounted once instead of per request.
+        adapter = HTTPAdapter(max_retries=CART_RETRY_STRATEGY)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logging.info(f"CartAgent.__init__() | Initialization complete")
         
     def _get_cart(self, user_id: int) -> Cart:
@@ -63,12 +78,8 @@ class CartAgent():
 
     def _add_to_cart(self, user_id: int, item_name: str, quantity: int) -> str:
         # First we have to perfom a retrieval to ensure that the item being looked for is in the catalog.
-        adapter = HTTPAdapter(max_retries=self.retry_strategy)
-        session = requests.Session()
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
         logging.info(f"CartAgent.add_to_cart() | /query/text -- getting response\n\t| query: {item_name}\n\t")
-        ret_response = session.post(
+        ret_response = self.session.post(
             f"{self.catalog_retriever_port}/query/text",
             json={
                 "text": [item_name],
@@ -99,12 +110,8 @@ class CartAgent():
 
     def _remove_from_cart(self, user_id: int, item_name: str, quantity: int) -> str:
         # First we have to perfom a retrieval to ensure that the item being looked for is in the catalog.
-        adapter = HTTPAdapter(max_retries=self.retry_strategy)
-        session = requests.Session()
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
         logging.info(f"CartAgent.remove_from_cart() | /query/text -- getting response\n\t| query: {item_name}\n\t")
-        ret_response = session.post(
+        ret_response = self.session.post(
             f"{self.catalog_retriever_port}/query/text",
             json={
                 "text": [item_name],
@@ -151,14 +158,10 @@ class CartAgent():
         """
         start = time.monotonic()
         logging.info(f"CartAgent.invoke() | Starting with query: {state.query}")
-        tools = [add_to_cart_function, remove_from_cart_function, view_cart_function]
         
         # Create proper ChatCompletionMessageParam objects
         messages: list[ChatCompletionMessageParam] = [
-            {
-                "role": "system", 
-                "content": "You are a retail agent that assists shoppers with their cart.\nOnly use the tools provided to help them."
-            },
+            CART_SYSTEM_MESSAGE,
             {
                 "role": "user", 
                 "content": f"USER QUERY: {state.query}\nCONTEXT: {state.context}"
@@ -171,7 +174,7 @@ class CartAgent():
             messages=messages,
             temperature=0.0,
             max_tokens=8192,
-            tools=tools,
+            tools=CART_TOOLS,
             tool_choice="auto",
             stream=False
         )
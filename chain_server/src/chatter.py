@@ -2,11 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import AsyncGenerator
-from openai import AsyncOpenAI
 from langgraph.config import get_stream_writer
 from .agenttypes import State
-import json
-import os
+from .llm_clients import get_async_openai
+import orjson
 import logging
 import sys
 import time
@@ -21,6 +20,11 @@ def setup_logging():
 
 # Configuration will be loaded by the main application
 
+# Streamed tokens are coalesced into one content event every STREAM_FLUSH_TOKENS tokens,
+# or after STREAM_FLUSH_INTERVAL seconds, whichever comes first.
+STREAM_FLUSH_TOKENS = 8
+STREAM_FLUSH_INTERVAL = 0.05
+
 
 class ChatterAgent:
     def __init__(self, config):
@@ -30,16 +34,15 @@ class ChatterAgent:
         Args:
             config: Configuration instance
         """
-        logging.info(f"ChatterAgent.__init__() | Initializing with llm_name={config.llm_name}, llm_port={config.llm_port}")
+        logging.info("ChatterAgent.__init__() | Initializing with llm_name=%s, llm_port=%s", config.llm_name, config.llm_port)
         self.llm_name = config.llm_name
         self.llm_port = config.llm_port
         self.config = config
+        # The system prompt is the same for every request, so its message is built once.
+        self.system_message = {"role": "system", "content": config.chatter_prompt}
         
-        self.model = AsyncOpenAI(
-            base_url=config.llm_port, 
-            api_key=os.environ["LLM_API_KEY"]
-        )
-        logging.info(f"ChatterAgent.__init__() | Initialization complete")
+        self.model = get_async_openai(config.llm_port)
+        logging.info("ChatterAgent.__init__() | Initialization complete")
 
     async def invoke(
         self, 
@@ -49,38 +52,35 @@ class ChatterAgent:
         """
         Process the user query and generate a response with streaming.
         """
-        logging.info(f"ChatterAgent.invoke() | Starting with query: {state.query}")
+        logging.info("ChatterAgent.invoke() | Starting with query: %s", state.query)
         output_state = state
-        logging.info(f"ChatterAgent.invoke() | State retrieved.")
+        logging.info("ChatterAgent.invoke() | State retrieved.")
 
         if state.query:
             user_message = f"QUERY: {state.query}"
-            if state.context and state.context.strip():
-                user_message += f"\nPREVIOUS CONTEXT: {state.context}"
-            messages = [
-                {"role": "system", "content": self.config.chatter_prompt},
-                {"role": "user", "content": user_message}
-            ]
         else:
             user_message = "QUERY: 'You have been sent an image, and the retrieved items are the most similar items.'"
-            if state.context and state.context.strip():
-                user_message += f"\nPREVIOUS CONTEXT: {state.context}"
-            messages = [
-                {"role": "system", "content": self.config.chatter_prompt},
-                {"role": "user", "content": user_message}
-            ]
+        if state.context and state.context.strip():
+            user_message = f"{user_message}\nPREVIOUS CONTEXT: {state.context}"
+        messages = [
+            self.system_message,
+            {"role": "user", "content": user_message}
+        ]
 
         start = time.monotonic()
 
-        logging.info(f"ChatterAgent.invoke() | Context length is less than memory length")
-        full_response = ""
+        logging.info("ChatterAgent.invoke() | Context length is less than memory length")
+        # Response pieces are joined once at the end instead of growing a string per token.
+        parts = []
+        pending = []
+        last_flush = time.monotonic()
         
         ftr = False
 
         writer = get_stream_writer()
 
         # Send our 'retrieved' dictionary.
-        writer(f"{json.dumps({'type' : 'images' , 'payload' : state.retrieved, 'timestamp' : time.time()})}")
+        writer(orjson.dumps({'type' : 'images' , 'payload' : state.retrieved, 'timestamp' : time.time()}).decode())
 
         stream = await self.model.chat.completions.create(
             model=self.llm_name,
@@ -93,21 +93,31 @@ class ChatterAgent:
         async for chunk in stream:
             if chunk.choices[0].delta.content:
                 content = chunk.choices[0].delta.content
-                full_response += content
-                output_state.response = full_response
+                parts.append(content)
+                pending.append(content)
+                now = time.monotonic()
 
                 if not ftr:
                     ftr = True
-                    ftt = time.monotonic() - start
-                    logging.info(f"ChatterAgent.invoke() | First token time: {ftt}")
+                    ftt = now - start
+                    logging.info("ChatterAgent.invoke() | First token time: %s", ftt)
                     output_state.timings["first_token"] = ftt
+                    # Send the first token right away so time to first token is unchanged.
+                    last_flush = 0.0
+
+                if len(pending) >= STREAM_FLUSH_TOKENS or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                    writer(orjson.dumps({'type' : 'content', 'payload' : ''.join(pending), 'timestamp' : time.time()}).decode())
+                    pending.clear()
+                    last_flush = now
 
-                writer(f"{json.dumps({'type' : 'content', 'payload' : content, 'timestamp' : time.time()})}")
+        if pending:
+            writer(orjson.dumps({'type' : 'content', 'payload' : ''.join(pending), 'timestamp' : time.time()}).decode())
 
+        full_response = "".join(parts)
         output_state.response = full_response
         output_state.context = f"{state.context}\n{full_response}"
             
-        logging.info(f"ChatterAgent.invoke() | Returning final state with response: {output_state.response[0:50]}")
+        logging.info("ChatterAgent.invoke() | Returning final state with response: %s", output_state.response[0:50])
 
         end = time.monotonic()
         output_state.timings["chatter"] = end - start
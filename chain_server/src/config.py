@@ -16,6 +16,12 @@ from pydantic import BaseModel, Field, validator
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C parser when PyYAML was built with it; fall back to the pure-Python parser otherwise.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def load_config_with_override(base_config_path: str) -> Dict[str, Any]:
     """
@@ -37,7 +43,7 @@ def load_config_with_override(base_config_path: str) -> Dict[str, Any]:
         raise FileNotFoundError(f"Base config file not found at {base_config_path}")
 
     with open(base_config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
     
     # Check for override config
     override_file = os.environ.get("CONFIG_OVERRIDE")
@@ -49,7 +55,7 @@ def load_config_with_override(base_config_path: str) -> Dict[str, Any]:
         if os.path.exists(override_path):
             logger.info(f"Loading override config from {override_path}")
             with open(override_path, "r") as f:
-                override_config = yaml.safe_load(f)
+                override_config = yaml.load(f, Loader=YamlLoader)
             
             # Merge override config into base config
             config.update(override_config)
@@ -124,6 +130,10 @@ class ChainServerConfig(BaseModel):
         validate_assignment = True  # Validate when attributes are set
 
 
+# Configuration loaded by load_config, shared by every module that calls get_config.
+_config: Optional[ChainServerConfig] = None
+
+
 def load_config(config_path: Optional[str] = None) -> ChainServerConfig:
     """
     Load configuration from YAML file with optional override support.
@@ -146,6 +156,23 @@ def load_config(config_path: Optional[str] = None) -> ChainServerConfig:
     
     # Create Pydantic config instance
     try:
-        return ChainServerConfig(**config_data)
+        config = ChainServerConfig(**config_data)
     except Exception as e:
-        raise ValueError(f"Configuration validation failed: {e}") 
\ No newline at end of file
+        raise ValueError(f"Configuration validation failed: {e}")
+
+    global _config
+    _config = config
+    return config
+
+
+def get_config() -> ChainServerConfig:
+    """
+    Return the configuration loaded by load_config, loading the default config on first use.
+    The YAML files are parsed and validated once per process.
+    
+    Returns:
+        ChainServerConfig: The loaded configuration
+    """
+    if _config is None:
+        return load_config()
+    return _config 
\ No newline at end of file
@@ -11,7 +11,7 @@ from typing import Any
 import time
 import logging
 import requests
-import json
+import orjson
 import sys
 
 from langgraph.graph import StateGraph, START, END
@@ -33,6 +33,9 @@ logger = logging.getLogger(__name__)
 # Global configuration variable
 _config = None
 
+# Summary agent whose background context writes get_memory waits for
+_summary_agent = None
+
 
 class GraphNodes:
     """Container for graph node functions."""
@@ -42,6 +45,10 @@ class GraphNodes:
         """Retrieve user memory and cart from the memory service."""
         start = time.monotonic()
         logger.info(f"GraphNodes.get_memory() | Retrieving memory for user {state.user_id}")
+
+        # The previous turn's context is written in the background; read it only once it has landed.
+        if _summary_agent is not None:
+            await _summary_agent.wait_for_context_write(state.user_id)
         
         try:
             # Retrieve memory from the memory database
@@ -164,7 +171,7 @@ class GraphNodes:
         """Handle unsafe content by returning a safe message."""
         unsafe_message = _config.unsafe_message
         writer = get_stream_writer()
-        writer(f"{json.dumps({'type': 'content', 'payload': unsafe_message, 'timestamp': time.time()})}")
+        writer(orjson.dumps({'type': 'content', 'payload': unsafe_message, 'timestamp': time.time()}).decode())
         return {"response": unsafe_message}
 
 
@@ -215,8 +222,9 @@ def create_graph(
     logger.info("Creating shopping assistant graph")
     
     # Set the global config for use throughout the graph
-    global _config
+    global _config, _summary_agent
     _config = config
+    _summary_agent = summary_agent
     
     # Create the graph
     graph = StateGraph(State)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Shared LLM clients for the chain server agents.
+
+Every agent talks to the same LLM endpoint, so one client per base URL is
+created and reused. The agents then share a single connection pool instead
+of each opening its own.
+"""
+
+from functools import lru_cache
+from openai import AsyncOpenAI, OpenAI
+import httpx
+import os
+
+# Connection pool limits for the shared LLM clients.
+LLM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+@lru_cache(maxsize=None)
+def get_openai(base_url: str) -> OpenAI:
+    """
+    Return the shared synchronous client for base_url.
+    """
+    return OpenAI(
+        base_url=base_url,
+        api_key=os.environ["LLM_API_KEY"],
+        http_client=httpx.Client(limits=LLM_HTTP_LIMITS)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_openai(base_url: str) -> AsyncOpenAI:
+    """
+    Return the shared asynchronous client for base_url.
+    """
+    return AsyncOpenAI(
+        base_url=base_url,
+        api_key=os.environ["LLM_API_KEY"],
+        http_client=httpx.AsyncClient(limits=LLM_HTTP_LIMITS)
+    )
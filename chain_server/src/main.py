@@ -8,6 +8,7 @@ This module provides the main API endpoints for the shopping assistant,
 including query processing and streaming responses.
 """
 from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -58,11 +59,20 @@ except Exception as e:
     logger.error(f"Failed to initialize application: {e}")
     raise
 
+# Close the agents' pooled HTTP clients on shutdown.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    for agent in agents.values():
+        if hasattr(agent, "aclose"):
+            await agent.aclose()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Shopping Assistant API",
     description="AI-powered shopping assistant with multi-agent architecture",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
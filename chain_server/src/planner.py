@@ -7,14 +7,13 @@ Query routing agent for the Shopping Assistant.
 This module contains the PlannerAgent that determines which specialized agent
 should handle a user's query based on the query content and context.
 """
-import os
 import logging
 import sys
 import time
 from typing import Tuple, Dict, List
-from openai import OpenAI
 
 from .agenttypes import State, Cart
+from .llm_clients import get_openai
 
 
 # Configure logging
@@ -56,10 +55,7 @@ class PlannerAgent:
         
         # Initialize the LLM client
         try:
-            self.model = OpenAI(
-                base_url=self.llm_port,
-                api_key=os.environ.get("LLM_API_KEY")
-            )
+            self.model = get_openai(self.llm_port)
             logger.info("PlannerAgent.__init__() | initialization complete")
         except Exception as e:
             logger.error(f"Failed to initialize PlannerAgent: {e}")
@@ -9,15 +9,15 @@ the catalog retriever service to find relevant products.
 
 from .agenttypes import State
 from .functions import retrieval_extraction_function
-from openai import OpenAI
-import os
-import json
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from .llm_clients import get_async_openai
+import orjson
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 import sys
 from typing import Tuple, List, Dict, Any
+from collections import OrderedDict
 import asyncio
+import hashlib
 import logging
 import time
 
@@ -29,14 +29,60 @@ def setup_logging():
         stream=sys.stdout
     ) 
 
+logger = logging.getLogger(__name__)
+
 # Configuration will be loaded by the main application
 
+# Catalog retriever responses that are retried, with exponential backoff, before giving up.
+CATALOG_RETRY_STATUSES = {422, 429, 500, 502, 503, 504}
+
+# Number of extracted retrieval inputs kept per process, keyed by the query and its conversation context.
+EXTRACTION_CACHE_SIZE = 256
+
+# Tools offered to the retrieval input extractor on every request.
+EXTRACTION_TOOLS = [retrieval_extraction_function]
+
+# Static part of the extractor system prompt; RetrieverAgent appends the configured categories once.
+EXTRACTION_SYSTEM_PROMPT = """You are a retrieval input extractor. Your task is to identify the specific product the user is asking about based on the conversation history.
+
+    CRITICAL RULES:
+    1.  **Analyze Intent:** Determine if the user's "Current question" is a follow-up about a previously discussed product or a request for a new product.
+    2.  **Follow-up Clues:** Questions about attributes (e.g., "other colors", "different sizes") or using pronouns (e.g., "it", "that", "those") strongly suggest a follow-up.
+    3.  **For Follow-ups, Use Context:** If the question is a follow-up, you MUST extract the full, specific product name from the "Previous conversation context".
+    4.  **For New Searches, Use Query:** If the user is asking for a new type of item, you MUST extract the search term directly from the "Current question".
+    5.  **Strict Separation:** Never merge or combine terms from the context with terms from the current query.
+
+    **Decision Logic:**
+
+    -   **IF** the `Current question` refers to an existing item (e.g., "does it come in blue?")
+        **AND** the `Previous conversation context` contains a specific `[Product Name]`,
+        **THEN** you must extract that `[Product Name]`.
+
+    -   **IF** the `Current question` introduces a new item (e.g., "show me some hats"),
+        **THEN** you must extract `hats`.
+
+    -   For categories, only choose from the provided available categories.
+        You may reuse the same category if only one is relevant.
+
+    -   For filters, return only explicit constraints.
+        If price bounds are present, return numeric values without currency symbols.
+
+    Your goal is to use the context to understand *references*, not to interfere with *new searches*.
+    """
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry connection failures and the status codes in CATALOG_RETRY_STATUSES."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in CATALOG_RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
 class RetrieverAgent():
     def __init__(
         self,
         config,
     ) -> None:
-        logging.info(f"RetrieverAgent.__init__() | Initializing with llm_name={config.llm_name}, llm_port={config.llm_port}")
+        logger.info("RetrieverAgent.__init__() | Initializing with llm_name=%s, llm_port=%s", config.llm_name, config.llm_port)
         self.llm_name = config.llm_name
         self.llm_port = config.llm_port
         
@@ -44,9 +90,28 @@ class RetrieverAgent():
         self.catalog_retriever_url = config.retriever_port
         self.k_value = config.top_k_retrieve
         self.categories = config.categories
+        # The category list is fixed, so it is appended to the static system prompt once. Keeping every
+        # static line ahead of the per-request text lets the LLM server reuse the cached prefix.
+        self.extraction_system_message = {
+            "role": "system",
+            "content": f"{EXTRACTION_SYSTEM_PROMPT}\nAvailable categories: {', '.join(config.categories)}"
+        }
         
-        self.model = OpenAI(base_url=config.llm_port, api_key=os.environ["LLM_API_KEY"])
-        logging.info(f"RetrieverAgent.__init__() | Initialization complete")
+        self.model = get_async_openai(config.llm_port)
+
+        # One pooled async client for all catalog retriever calls, so requests reuse kept-alive
+        # connections and never block the event loop. A short connect timeout lets an unreachable
+        # retriever fail over to the next retry quickly.
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(30.0, connect=2.0)
+        )
+
+        # LRU cache of extraction results, so a repeated request skips the LLM round-trip.
+        self._extraction_cache: OrderedDict = OrderedDict()
+        # Extractions currently waiting on the LLM, so concurrent identical requests share one call.
+        self._extraction_in_flight: Dict[bytes, asyncio.Task] = {}
+        logger.info("RetrieverAgent.__init__() | Initialization complete")
 
     async def invoke(
         self,
@@ -56,7 +121,7 @@ class RetrieverAgent():
         """
         Process the user query to determine categories and retrieve relevant products.
         """
-        logging.info(f"RetrieverAgent.invoke() | Starting with query: {state.query}")
+        logger.info("RetrieverAgent.invoke() | Starting with query: %s", state.query)
 
         # Set our k value for retrieval.
         k = self.k_value
@@ -73,29 +138,17 @@ class RetrieverAgent():
         # Query the catalog retriever service
         start = time.monotonic()
         try:
-
-            retry_strategy = Retry(
-                total=3,                    
-                status_forcelist=[422, 429, 500, 502, 503, 504],  
-                allowed_methods=["POST"],   
-                backoff_factor=1            
-            )
-            
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session = requests.Session()
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
-
             if image:
-                logging.info(
+                logger.info(
                     "RetrieverAgent.invoke() | /query/image -- getting response.\n"
-                    f"\t| entities: {entities}\n"
-                    f"\t| categories: {categories}\n"
-                    f"\t| filters: {filters}"
+                    "\t| entities: %s\n"
+                    "\t| categories: %s\n"
+                    "\t| filters: %s",
+                    entities, categories, filters
                 )
-                response = session.post(
-                    f"{self.catalog_retriever_url}/query/image",
-                    json={
+                results = await self._post_catalog(
+                    "/query/image",
+                    {
                         "text": entities,
                         "image_base64": image,
                         "categories": categories,
@@ -104,155 +157,195 @@ class RetrieverAgent():
                     }
                 )
             else:
-                logging.info(
+                logger.info(
                     "RetrieverAgent.invoke() | /query/text -- getting response\n"
-                    f"\t| query: {entities}\n"
-                    f"\t| categories: {categories}\n"
-                    f"\t| filters: {filters}"
+                    "\t| query: %s\n"
+                    "\t| categories: %s\n"
+                    "\t| filters: %s",
+                    entities, categories, filters
                 )
-                response = session.post(
-                    f"{self.catalog_retriever_url}/query/text",
-                    json={
+                results = await self._post_catalog(
+                    "/query/text",
+                    {
                         "text": entities,
                         "categories": categories,
                         "filters": filters,
                         "k": k
                     }
                 )
-
-            response.raise_for_status()
-            results = response.json()
             
             # Format the response with product details
             if results["texts"]:
-                products = []
-                retrieved_dict = {}
-                for text, name, img, sim in zip(results["texts"], results["names"], results["images"], results["similarities"]):
-                    products.append(text)
-                    retrieved_dict[name] = img
-                state.response = f"These products are available in the catalog:\n" + "\n".join(products)
-                state.retrieved = retrieved_dict
+                state.response = "These products are available in the catalog:\n" + "\n".join(results["texts"])
+                state.retrieved = dict(zip(results["names"], results["images"]))
             else:
                 state.response = "Unfortunately there are no products closely matching the user's query."
             
-            logging.info(f"RetrieverAgent.invoke() | Retriever returned context.")
+            logger.info("RetrieverAgent.invoke() | Retriever returned context.")
             
             # Update context
             state.context = f"{state.context}\n{state.response}"
             
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError covers a malformed or non-JSON catalog response (orjson.JSONDecodeError).
             if verbose:
-                logging.error(f"RetrieverAgent.invoke() | Error querying catalog retriever service: {str(e)}")
+                logger.error("RetrieverAgent.invoke() | Error querying catalog retriever service: %s", e)
             state.response = "I encountered an error while searching for products. Please try again."
         end = time.monotonic()
         state.timings["retriever_retrieval"] = end - start
 
-        logging.info(f"RetrieverAgent.invoke() | Returning final state with response.")
+        logger.info("RetrieverAgent.invoke() | Returning final state with response.")
 
         return state
 
+    async def aclose(self) -> None:
+        """
+        Close the pooled catalog retriever client. Called on application shutdown.
+        """
+        await self.http_client.aclose()
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(4),
+        wait=wait_exponential(multiplier=1, max=4),
+        reraise=True
+    )
+    async def _post_catalog(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a query to the catalog retriever service and return the decoded response.
+        """
+        response = await self.http_client.post(f"{self.catalog_retriever_url}{path}", json=payload)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def _extract_retrieval_inputs(self, state: State) -> Tuple[List[str], List[str], Dict[str, float]]:
         """
         Extract retrieval entities, categories, and structured filters from the user request.
         """
         query_text = state.query or ""
-        logging.info(f"RetrieverAgent | _extract_retrieval_inputs() | Starting with query (first 50 characters): {query_text[:50]}")
-        category_list = self.categories
+        logger.info("RetrieverAgent | _extract_retrieval_inputs() | Starting with query (first 50 characters): %s", query_text[:50])
         entity_list = []
         filters: Dict[str, float] = {}
         entities: List[str] = [query_text] if query_text else []
-        categories = category_list
+        categories = self.categories
 
         if query_text:
-            logging.info("RetrieverAgent | _extract_retrieval_inputs() | Extracting retrieval inputs.")
-            category_list_str = ", ".join(category_list)
-            # Split the query into user question and context for clarity
-            user_question = query_text
-            conversation_context = state.context
-            
-            extraction_messages = [
-                {"role": "system", "content": """You are a retrieval input extractor. Your task is to identify the specific product the user is asking about based on the conversation history.
-
-    CRITICAL RULES:
-    1.  **Analyze Intent:** Determine if the user's "Current question" is a follow-up about a previously discussed product or a request for a new product.
-    2.  **Follow-up Clues:** Questions about attributes (e.g., "other colors", "different sizes") or using pronouns (e.g., "it", "that", "those") strongly suggest a follow-up.
-    3.  **For Follow-ups, Use Context:** If the question is a follow-up, you MUST extract the full, specific product name from the "Previous conversation context".
-    4.  **For New Searches, Use Query:** If the user is asking for a new type of item, you MUST extract the search term directly from the "Current question".
-    5.  **Strict Separation:** Never merge or combine terms from the context with terms from the current query.
-
-    **Decision Logic:**
-
-    -   **IF** the `Current question` refers to an existing item (e.g., "does it come in blue?")
-        **AND** the `Previous conversation context` contains a specific `[Product Name]`,
-        **THEN** you must extract that `[Product Name]`.
-
-    -   **IF** the `Current question` introduces a new item (e.g., "show me some hats"),
-        **THEN** you must extract `hats`.
-
-    -   For categories, only choose from the provided available categories.
-        You may reuse the same category if only one is relevant.
+            cache_key = self._extraction_cache_key(query_text, state.context)
+            cached = self._extraction_cache.get(cache_key)
+            if cached is not None:
+                self._extraction_cache.move_to_end(cache_key)
+                logger.info("RetrieverAgent | _extract_retrieval_inputs() | Using cached retrieval inputs.")
+                cached_entities, cached_categories, cached_filters = cached
+                return list(cached_entities), list(cached_categories), dict(cached_filters)
+
+            in_flight = self._extraction_in_flight.get(cache_key)
+            if in_flight is not None:
+                # An identical request is already asking the LLM; share its answer instead of sending another.
+                logger.info("RetrieverAgent | _extract_retrieval_inputs() | Waiting on in-flight extraction.")
+            else:
+                # Run the LLM call as its own task, so cancelling the request that started it
+                # does not cancel the other requests waiting on the same extraction.
+                in_flight = asyncio.create_task(self._extract_with_llm(query_text, state.context))
+                self._extraction_in_flight[cache_key] = in_flight
+                in_flight.add_done_callback(lambda task: self._finish_extraction(cache_key, task))
+
+            entities, categories, filters = await asyncio.shield(in_flight)
+            return list(entities), list(categories), dict(filters)
+        else:
+            logger.info("RetrieverAgent | _extract_retrieval_inputs() | No valid query.")
+            return entity_list, categories, filters
 
-    -   For filters, return only explicit constraints.
-        If price bounds are present, return numeric values without currency symbols.
+    def _finish_extraction(self, cache_key: bytes, task: asyncio.Task) -> None:
+        """
+        Done callback of a shared extraction task: stop sharing it and cache a successful result.
+        """
+        if self._extraction_in_flight.get(cache_key) is task:
+            del self._extraction_in_flight[cache_key]
+        if task.cancelled():
+            return
+        # Retrieve the exception even when every waiter has gone, so it is not reported as unhandled.
+        if task.exception() is not None:
+            return
+        entities, categories, filters = task.result()
+        self._extraction_cache[cache_key] = (tuple(entities), tuple(categories), dict(filters))
+        if len(self._extraction_cache) > EXTRACTION_CACHE_SIZE:
+            self._extraction_cache.popitem(last=False)
+
+    async def _extract_with_llm(self, query_text: str, context: str | None) -> Tuple[List[str], List[str], Dict[str, float]]:
+        """
+        Ask the LLM for the retrieval entities, categories, and filters of one query.
+        """
+        entities: List[str] = [query_text]
+        categories = self.categories
+        filters: Dict[str, float] = {}
 
-    Your goal is to use the context to understand *references*, not to interfere with *new searches*.
-    """},
-                {"role": "user", "content": f"""Current question: {user_question}
+        logger.info("RetrieverAgent | _extract_with_llm() | Extracting retrieval inputs.")
+        # Split the query into user question and context for clarity
+        user_question = query_text
+        conversation_context = context
+        
+        extraction_messages = [
+            self.extraction_system_message,
+            {"role": "user", "content": f"""Current question: {user_question}
 
 Previous conversation context: {conversation_context}
-Available categories: {category_list_str}
 
 Apply the decision logic and extract retrieval inputs."""}
-            ]
-
-            extraction_response = await asyncio.to_thread(
-                self.model.chat.completions.create,
-                model=self.llm_name,
-                messages=extraction_messages,
-                tools=[retrieval_extraction_function],
-                tool_choice="auto",
-                temperature=0.0
-            )
-
-            logging.info(
-                "RetrieverAgent | _extract_retrieval_inputs()\n"
-                f"\t| Combined Extraction Response: {extraction_response}"
-            )
-            
-            # Add debug logging to see what query was sent
-            logging.info(f"RetrieverAgent | _extract_retrieval_inputs() | Query sent to retrieval extractor: {user_question[:200]}...")
-
-            if extraction_response.choices[0].message.tool_calls:
-                response_dict = json.loads(extraction_response.choices[0].message.tool_calls[0].function.arguments)
-                entity_list = response_dict.get("search_entities", [])
-                if isinstance(entity_list, str):
-                    logging.info(f"RetrieverAgent | _extract_retrieval_inputs()\n\t| Entity list {entity_list}")
-                    cleaned = entity_list.strip("[]")
-                    entities = [item.strip().strip("'\"") for item in cleaned.split(',')]
-                else:
-                    entities = entity_list
-                category_list = [
-                    response_dict.get("category_one", ""),
-                    response_dict.get("category_two", ""),
-                    response_dict.get("category_three", ""),
-                    ]
-                if isinstance(category_list, str):
-                    logging.info(f"RetrieverAgent | _extract_retrieval_inputs()\n\t| Category list {category_list}")
-                    cleaned = category_list.strip("[]")
-                    categories = [item.strip().strip("'\"") for item in cleaned.split(',')]
-                else:
-                    categories = category_list
-
-                filters = self._normalize_filters(response_dict)
-
-            logging.info(
-                "RetrieverAgent | _extract_retrieval_inputs() | "
-                f"entities: {entities}\n\t| categories: {categories}\n\t| filters: {filters}"
-            )
-            return entities, categories, filters
-        else:
-            logging.info("RetrieverAgent | _extract_retrieval_inputs() | No valid query.")
-            return entity_list, categories, filters
+        ]
+
+        extraction_response = await self.model.chat.completions.create(
+            model=self.llm_name,
+            messages=extraction_messages,
+            tools=EXTRACTION_TOOLS,
+            tool_choice="auto",
+            temperature=0.0
+        )
+
+        # The full ChatCompletion is large, so it is only logged at DEBUG level.
+        logger.debug(
+            "RetrieverAgent | _extract_with_llm()\n"
+            "\t| Combined Extraction Response: %s",
+            extraction_response
+        )
+        logger.debug("RetrieverAgent | _extract_with_llm() | Query sent to retrieval extractor: %s...", user_question[:200])
+
+        if extraction_response.choices[0].message.tool_calls:
+            response_dict = orjson.loads(extraction_response.choices[0].message.tool_calls[0].function.arguments)
+            entity_list = response_dict.get("search_entities", [])
+            if isinstance(entity_list, str):
+                logger.info("RetrieverAgent | _extract_with_llm()\n\t| Entity list %s", entity_list)
+                cleaned = entity_list.strip("[]")
+                entities = [item.strip().strip("'\"") for item in cleaned.split(',')]
+            else:
+                entities = entity_list
+            categories = [
+                response_dict.get("category_one", ""),
+                response_dict.get("category_two", ""),
+                response_dict.get("category_three", ""),
+                ]
+
+            filters = self._normalize_filters(response_dict)
+
+        logger.info(
+            "RetrieverAgent | _extract_with_llm() | "
+            "entities: %s\n\t| categories: %s\n\t| filters: %s",
+            entities, categories, filters
+        )
+        return entities, categories, filters
+
+    @staticmethod
+    def _extraction_cache_key(query: str, context: str | None) -> bytes:
+        """
+        Cache key for extracted retrieval inputs. Follow-ups depend on the context, so it is part of the key.
+        The query is case-folded, its whitespace collapsed and trailing punctuation dropped, so trivial
+        rewordings such as "Red dress" and "red dress?" share one entry.
+        """
+        normalized_query = " ".join(query.casefold().split()).rstrip(" .!?")
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(normalized_query.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update((context or "").encode("utf-8"))
+        return digest.digest()
 
     @staticmethod
     def _normalize_numeric_filter(value: Any) -> float | None:
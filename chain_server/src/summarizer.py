@@ -1,12 +1,14 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from openai import OpenAI
 from .agenttypes import State
 from .functions import summary_function
-import requests
-import json
-import os
+from .llm_clients import get_async_openai
+from collections import OrderedDict
+from typing import Dict
+import asyncio
+import httpx
+import orjson
 import logging
 import sys
 import time
@@ -21,6 +23,40 @@ def setup_logging():
 
 # Configuration will be loaded by the main application
 
+# Once a user's context has been summarized, it is only summarized again after growing by
+# this fraction of memory_length, instead of on every turn it stays over the limit.
+SUMMARY_GROWTH_FRACTION = 0.25
+
+# Number of users whose post-summary context length is remembered, least recently used first out.
+SUMMARY_WATERMARK_CACHE_SIZE = 10000
+
+# Tools offered to the summarizer on every request.
+SUMMARY_TOOLS = [summary_function]
+
+# The summarizer system prompt never changes, so its message is built once.
+SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": """You are a conversation summarizer for a shopping assistant. 
+
+                CRITICAL RULES:
+                1. You MUST preserve ALL product information, including:
+                - Complete product names with all descriptors
+                - ALL care instructions (washing, drying, ironing, dry cleaning instructions)
+                - Materials and fabric composition
+                - Prices
+                - Colors, sizes, and any other specifications
+
+                2. For ANY product the user has shown interest in or asked about:
+                - Keep the ENTIRE product description including all details
+                - Preserve any attributes mentioned (care instructions, materials, features)
+
+                3. You may condense only:
+                - General conversation flow and greetings
+                - Redundant phrases that don't contain product information
+                - User's general preferences (but keep specific requirements)
+
+                4. NEVER remove or shorten product specifications, even to save space.
+
+                The goal is to maintain all factual product information while reducing conversational overhead."""}
+
 class SummaryAgent:
     def __init__(self, config):
         """
@@ -29,18 +65,27 @@ class SummaryAgent:
         Args:
             config: Configuration instance
         """
-        logging.info(f"SummaryAgent.__init__() | Initializing with llm_name={config.llm_name}, llm_port={config.llm_port}")
+        logging.info("SummaryAgent.__init__() | Initializing with llm_name=%s, llm_port=%s", config.llm_name, config.llm_port)
         self.llm_name = config.llm_name
         self.llm_port = config.llm_port
         
         # Store configuration
         self.memory_length = config.memory_length
         self.memory_port = config.memory_port
+        # Pooled client for the memory service, reused across requests.
+        self.http_client = httpx.AsyncClient(timeout=5.0)
+        # Context writes to the memory service run in the background. The latest pending write of each
+        # user is kept here, so the next turn can wait for it before reading the context back, and so the
+        # writes of one user are applied in order.
+        self._pending_writes: Dict[int, asyncio.Task] = {}
+        self.min_summary_growth = int(self.memory_length * SUMMARY_GROWTH_FRACTION)
+        # Context length right after each user's last summary.
+        self._last_summary_len: OrderedDict = OrderedDict()
         
-        self.model = OpenAI(base_url=config.llm_port, api_key=os.environ["LLM_API_KEY"])
-        logging.info(f"SummaryAgent.__init__() | Initialization complete")
+        self.model = get_async_openai(config.llm_port)
+        logging.info("SummaryAgent.__init__() | Initialization complete")
 
-    def invoke(
+    async def invoke(
         self, 
         state: State,
         verbose: bool = True
@@ -48,57 +93,95 @@ class SummaryAgent:
         """
         Process the user query and generate a response.
         """
-        logging.info(f"SummaryAgent.invoke() | Starting with query: {state.query}\n\t Context: {state.context}")
+        logging.info("SummaryAgent.invoke() | Starting with query: %s\n\t Context: %s", state.query, state.context)
         output_state = state
 
-        messages = [
-            {"role": "system", "content": """You are a conversation summarizer for a shopping assistant. 
-
-                CRITICAL RULES:
-                1. You MUST preserve ALL product information, including:
-                - Complete product names with all descriptors
-                - ALL care instructions (washing, drying, ironing, dry cleaning instructions)
-                - Materials and fabric composition
-                - Prices
-                - Colors, sizes, and any other specifications
-
-                2. For ANY product the user has shown interest in or asked about:
-                - Keep the ENTIRE product description including all details
-                - Preserve any attributes mentioned (care instructions, materials, features)
-
-                3. You may condense only:
-                - General conversation flow and greetings
-                - Redundant phrases that don't contain product information
-                - User's general preferences (but keep specific requirements)
-
-                4. NEVER remove or shorten product specifications, even to save space.
-
-                The goal is to maintain all factual product information while reducing conversational overhead."""},
-                            {"role": "user", "content": f"CONTEXT TO SUMMARIZE:\n{state.context}"}
-        ]
-
         start = time.monotonic()
-        if len(state.context) > self.memory_length:
-            logging.info(f"SummaryAgent.invoke() | Context length is greater than memory length")
-            response = self.model.chat.completions.create(
+        context_growth = len(state.context) - self._summary_watermark(state.user_id, len(state.context))
+        if len(state.context) > self.memory_length and context_growth >= self.min_summary_growth:
+            logging.info("SummaryAgent.invoke() | Context length is greater than memory length")
+            messages = [
+                SUMMARY_SYSTEM_MESSAGE,
+                {"role": "user", "content": f"CONTEXT TO SUMMARIZE:\n{state.context}"}
+            ]
+            response = await self.model.chat.completions.create(
                 model=self.llm_name,
                 messages=messages,
-                tools=[summary_function],
+                tools=SUMMARY_TOOLS,
                 tool_choice="auto",
                 stream=False,
                 temperature=0.0,
                 max_tokens=self.memory_length
             )
 
-            tool_json = json.loads(response.choices[0].message.tool_calls[0].function.arguments)
+            tool_json = orjson.loads(response.choices[0].message.tool_calls[0].function.arguments)
             output_state.context = tool_json["summary"]
-            logging.info(f"SummaryAgent.invoke() | Returning final state with response: {output_state.context}")
+            self._last_summary_len[state.user_id] = len(output_state.context)
+            self._last_summary_len.move_to_end(state.user_id)
+            if len(self._last_summary_len) > SUMMARY_WATERMARK_CACHE_SIZE:
+                self._last_summary_len.popitem(last=False)
+            logging.info("SummaryAgent.invoke() | Returning final state with response: %s", output_state.context)
         else:
-            logging.info(f"SummaryAgent.invoke() | Context length is less than memory length -- writing to memory.")
+            logging.info("SummaryAgent.invoke() | Context length is less than memory length -- writing to memory.")
         
-        requests.post(f"{self.memory_port}/user/{output_state.user_id}/context/replace", json={"new_context": output_state.context})
+        user_id = output_state.user_id
+        task = asyncio.create_task(
+            self._write_context(user_id, output_state.context, self._pending_writes.get(user_id))
+        )
+        self._pending_writes[user_id] = task
+        task.add_done_callback(lambda done: self._forget_write(user_id, done))
 
         end = time.monotonic()
         
-        logging.info(f"SummaryAgent.invoke() | Completed summarization in {end - start} seconds.")
+        logging.info("SummaryAgent.invoke() | Completed summarization in %s seconds.", end - start)
         return output_state
+
+    def _summary_watermark(self, user_id: int, context_len: int) -> int:
+        """
+        Context length right after the user's last summary, or 0 if there is none.
+        A context shorter than the watermark was cleared or replaced since, so the watermark is dropped.
+        """
+        watermark = self._last_summary_len.get(user_id)
+        if watermark is None:
+            return 0
+        if context_len < watermark:
+            del self._last_summary_len[user_id]
+            return 0
+        self._last_summary_len.move_to_end(user_id)
+        return watermark
+
+    async def aclose(self) -> None:
+        """
+        Let pending context writes finish, then close the memory service client. Called on application shutdown.
+        """
+        if self._pending_writes:
+            await asyncio.wait(set(self._pending_writes.values()))
+        await self.http_client.aclose()
+
+    async def wait_for_context_write(self, user_id: int) -> None:
+        """Wait until the user's pending context write, if any, has finished."""
+        task = self._pending_writes.get(user_id)
+        if task is not None:
+            # asyncio.wait neither raises the task's error nor cancels the write if the caller is cancelled.
+            await asyncio.wait({task})
+
+    def _forget_write(self, user_id: int, task: asyncio.Task) -> None:
+        """Drop a finished write, unless a newer write for the same user has replaced it."""
+        if self._pending_writes.get(user_id) is task:
+            del self._pending_writes[user_id]
+
+    async def _write_context(self, user_id: int, context: str, previous: asyncio.Task | None = None) -> None:
+        """
+        Replace the user's context in the memory service after the user's previous write, if any.
+        Failures are logged since no caller sees them.
+        """
+        if previous is not None:
+            await asyncio.wait({previous})
+        try:
+            response = await self.http_client.post(
+                f"{self.memory_port}/user/{user_id}/context/replace",
+                json={"new_context": context}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            logging.error("SummaryAgent | Failed to write context to memory: %s", error)
@@ -8,6 +8,12 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C parser when PyYAML was built with it; fall back to the pure-Python parser otherwise.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def apply_endpoint_overrides(config, config_dir: str = "/app/shared/configs"):
     """
@@ -33,7 +39,7 @@ def apply_endpoint_overrides(config, config_dir: str = "/app/shared/configs"):
     logger.info(f"Loading guardrails override config from {override_path}")
     
     with open(override_path, 'r') as f:
-        override_config = yaml.safe_load(f)
+        override_config = yaml.load(f, Loader=YamlLoader)
     
     # Extract base_url values from the override config
     if 'models' in override_config: